@@ -49,6 +49,48 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Request instrumentation: query count and db/use case/serialization time per
+# request in a Server-Timing header and a 'jasmine.requests' log line.
+# Requests over either threshold are logged as warnings with all their SQL.
+REQUEST_INSTRUMENTATION_ENABLED = os.environ.get('REQUEST_INSTRUMENTATION_ENABLED', 'True') == 'True'
+SLOW_REQUEST_QUERY_COUNT = int(os.environ.get('SLOW_REQUEST_QUERY_COUNT', 20))
+SLOW_REQUEST_MS = int(os.environ.get('SLOW_REQUEST_MS', 500))
+
+# Prometheus metrics at /metrics: latency by URL name, requests in flight,
+# SQL queries and cache hits. Each worker process writes its values to
+# METRICS_DIR (one file per live process, keep it on local disk); the counters
+# of exited processes are folded into an archive file there, and /metrics sums
+# them. /metrics answers only requests bearing METRICS_TOKEN (403 while unset).
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True') == 'True'
+METRICS_DIR = os.environ.get('METRICS_DIR', '/tmp/jasmine_backend_metrics')
+METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', 1))
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+if METRICS_ENABLED:
+    MIDDLEWARE.insert(0, 'interfaces.rest.shared.middleware.RequestMetricsMiddleware')
+
+if REQUEST_INSTRUMENTATION_ENABLED:
+    # Outermost, so the total covers every other middleware (and the
+    # metrics middleware can read its query count)
+    MIDDLEWARE.insert(0, 'interfaces.rest.shared.middleware.RequestInstrumentationMiddleware')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'jasmine.requests': {
+            'handlers': ['console'],
+            'level': os.environ.get('REQUEST_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -72,20 +114,41 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 DATABASE_URL = os.environ.get("DATABASE_URL")
 
-if DATABASE_URL:
+
+def _database_from_url(url):
+    """Database settings for a DATABASE_URL-style URL."""
     import dj_database_url
 
-    DATABASES = {
-        "default": dj_database_url.parse(
-            DATABASE_URL,
-            ssl_require=True,
-        )
-    }
+    database = dj_database_url.parse(
+        url,
+        ssl_require=not url.startswith("sqlite"),
+    )
 
-    if "pooler.supabase.com" in DATABASE_URL:
-        DATABASES["default"]["CONN_MAX_AGE"] = 0
+    if os.environ.get("DB_POOL_ENABLED", "False") == "True":
+        # Application-side pool: requests borrow an open connection and hand
+        # it back instead of reconnecting (works behind pooler.supabase.com too)
+        database["ENGINE"] = "src.infrastructure.db.backends.pooled_postgresql"
+        database["CONN_MAX_AGE"] = 0
+        database["DISABLE_SERVER_SIDE_CURSORS"] = True
+        database["POOL"] = {
+            "MAX_SIZE": int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+            "MAX_LIFETIME": int(os.environ.get("DB_POOL_MAX_LIFETIME", 1800)),
+            "CHECK_AFTER": int(os.environ.get("DB_POOL_CHECK_AFTER", 30)),
+            "TIMEOUT": int(os.environ.get("DB_POOL_TIMEOUT", 30)),
+        }
+    elif "pooler.supabase.com" in url:
+        database["CONN_MAX_AGE"] = 0
     else:
-        DATABASES["default"]["CONN_MAX_AGE"] = 600
+        # Use 0 under ASGI: each request runs its queries on its own thread,
+        # so persistent connections would never be reused
+        database["CONN_MAX_AGE"] = int(os.environ.get("DB_CONN_MAX_AGE", 600))
+    return database
+
+
+if DATABASE_URL:
+    DATABASES = {
+        "default": _database_from_url(DATABASE_URL)
+    }
 
 else:
     DATABASES = {
@@ -95,6 +158,81 @@ else:
         }
     }
 
+# Read replicas: DATABASE_REPLICA_URL holds one or more comma-separated URLs
+# (e.g. sqlite:////path/to/replica.sqlite3 locally). Catalog and homepage
+# reads made while serving requests go to a replica; everything else, reads
+# inside transactions and clients that wrote in the last
+# DATABASE_REPLICA_STICKY_SECONDS stay on the primary.
+DATABASE_REPLICAS = []
+for _index, _url in enumerate(
+    url.strip() for url in os.environ.get("DATABASE_REPLICA_URL", "").split(",") if url.strip()
+):
+    _alias = f"replica_{_index + 1}"
+    DATABASES[_alias] = _database_from_url(_url)
+    DATABASES[_alias]["TEST"] = {"MIRROR": "default"}
+    DATABASE_REPLICAS.append(_alias)
+
+DATABASE_REPLICA_STICKY_SECONDS = int(os.environ.get("DATABASE_REPLICA_STICKY_SECONDS", 10))
+
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ["src.infrastructure.db.routers.ReadReplicaRouter"]
+    MIDDLEWARE.insert(1, "interfaces.rest.shared.middleware.ReplicaStickinessMiddleware")
+
+# Cache
+# Django's in-process cache unless CACHE_BACKEND is set. Everything stored in
+# it is keyed by a version stamp, so per-worker copies never go stale.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'CACHE_BACKEND',
+            'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+    },
+    # Version stamps and variant previews are invalidated by writes, so every
+    # worker has to read the same copy. The file-based default is shared by
+    # the workers of one host only: with several hosts or containers point it
+    # at Redis or memcached (SHARED_CACHE_BACKEND=
+    # django.core.cache.backends.redis.RedisCache, SHARED_CACHE_LOCATION=
+    # redis://...), or each host serves stale data until its own stamps move.
+    'shared': {
+        'BACKEND': os.environ.get(
+            'SHARED_CACHE_BACKEND',
+            'django.core.cache.backends.filebased.FileBasedCache'
+        ),
+        'LOCATION': os.environ.get('SHARED_CACHE_LOCATION', '/tmp/jasmine_backend_cache'),
+        'OPTIONS': {
+            # Far above the stamps plus one entry per variant group, so
+            # culling never evicts a stamp
+            'MAX_ENTRIES': int(os.environ.get('SHARED_CACHE_MAX_ENTRIES', 100000)),
+        },
+    },
+}
+
+# Product list totals are cached per filter set until the catalog changes;
+# ?count=estimate uses the Postgres planner estimate above the threshold.
+PRODUCT_COUNT_CACHE_TIMEOUT = int(os.environ.get('PRODUCT_COUNT_CACHE_TIMEOUT', 600))
+PRODUCT_COUNT_ESTIMATE_THRESHOLD = int(os.environ.get('PRODUCT_COUNT_ESTIMATE_THRESHOLD', 1000))
+
+# Variant group member previews (color swatches on product pages) are cached
+# per group and dropped whenever a member product or the group is saved.
+VARIANT_PREVIEW_CACHE_TIMEOUT = int(os.environ.get('VARIANT_PREVIEW_CACHE_TIMEOUT', 86400))
+
+# Product search: 'auto' picks Postgres full-text or SQLite FTS5 by database
+# vendor; 'simple' falls back to substring matching on name and brand.
+# PRODUCT_SEARCH_CONFIG is the Postgres text search configuration used for
+# both documents and queries; run `manage.py rebuild_search_index` after changing it.
+PRODUCT_SEARCH_BACKEND = os.environ.get('PRODUCT_SEARCH_BACKEND', 'auto')
+PRODUCT_SEARCH_CONFIG = os.environ.get('PRODUCT_SEARCH_CONFIG', 'english')
+
+# Serve product list pages from the denormalized read model (product_listings).
+# Build it with `manage.py rebuild_product_read_model` before enabling.
+PRODUCT_READ_MODEL_ENABLED = os.environ.get('PRODUCT_READ_MODEL_ENABLED', 'False') == 'True'
+
+# Public catalog and homepage responses carry ETag/Last-Modified validators;
+# clients and CDNs may reuse them for this many seconds before revalidating.
+CATALOG_HTTP_MAX_AGE = int(os.environ.get('CATALOG_HTTP_MAX_AGE', 0))
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -166,7 +304,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'interfaces.rest.shared.renderers.FastJSONRenderer',
     ),
 }
 
@@ -22,10 +22,17 @@ urlpatterns = [
         name='subcategory-list-by-category',
     ),
     path('api/products/', catalog_views.ProductListView.as_view(), name='product-list'),
+    path('api/products/facets/', catalog_views.ProductFacetsView.as_view(), name='product-facets'),
+    path('api/products/batch/', catalog_views.ProductBatchView.as_view(), name='product-batch'),
     path('api/products/<int:product_id>/', catalog_views.ProductDetailView.as_view(), name='product-detail'),
     path('api/home/', include('interfaces.rest.homepage.urls')),
 ]
 
+if settings.METRICS_ENABLED:
+    from interfaces.rest.metrics.views import MetricsView
+
+    urlpatterns.append(path('metrics', MetricsView.as_view(), name='metrics'))
+
 # Serve media files in development
 if settings.DEBUG:
     from django.views.static import serve
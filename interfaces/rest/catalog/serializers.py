@@ -1,5 +1,6 @@
 """Catalog serializers."""
 from rest_framework import serializers
+from interfaces.rest.shared.encoders import compile_encoder
 from src.application.catalog.dto import (
     CategoryResponse,
     CategoryWithSubcategoriesResponse,
@@ -37,6 +38,19 @@ class CategoryWithSubcategoriesResponseSerializer(serializers.Serializer):
     subcategories = SubcategoryResponseSerializer(many=True)
 
 
+class SubcategoryWithCountsResponseSerializer(SubcategoryResponseSerializer):
+    """Subcategory response serializer with product counts."""
+    product_count = serializers.IntegerField()
+    availability_counts = serializers.DictField(child=serializers.IntegerField())
+
+
+class CategoryWithCountsResponseSerializer(CategoryWithSubcategoriesResponseSerializer):
+    """Category response serializer with subcategories and product counts."""
+    subcategories = SubcategoryWithCountsResponseSerializer(many=True)
+    product_count = serializers.IntegerField()
+    availability_counts = serializers.DictField(child=serializers.IntegerField())
+
+
 class VariantProductPreviewSerializer(serializers.Serializer):
     """Variant product preview serializer."""
     id = serializers.IntegerField()
@@ -93,3 +107,100 @@ class PaginatedProductResponseSerializer(serializers.Serializer):
     has_next = serializers.BooleanField()
     has_previous = serializers.BooleanField()
 
+
+class CursorPaginatedProductResponseSerializer(serializers.Serializer):
+    """Keyset paginated product response serializer."""
+    items = ProductResponseSerializer(many=True)
+    page_size = serializers.IntegerField()
+    next_cursor = serializers.CharField(allow_null=True)
+    has_next = serializers.BooleanField()
+    total = serializers.IntegerField(allow_null=True)
+
+
+class ProductBatchResponseSerializer(serializers.Serializer):
+    """Product batch response serializer."""
+    items = ProductResponseSerializer(many=True)
+    missing_ids = serializers.ListField(child=serializers.IntegerField())
+
+
+class ProductCardResponseSerializer(serializers.Serializer):
+    """Product card serializer (grid view)."""
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    brand = serializers.CharField(allow_null=True)
+    price = serializers.CharField()
+    price_new = serializers.CharField(allow_null=True)
+    price_old = serializers.CharField(allow_null=True)
+    currency = serializers.CharField()
+    availability = serializers.CharField()
+    image = serializers.CharField(allow_null=True)
+    color_name = serializers.CharField(allow_null=True)
+    color_palette = serializers.CharField(allow_null=True)
+
+
+class PaginatedProductCardResponseSerializer(serializers.Serializer):
+    """Paginated product card response serializer."""
+    items = ProductCardResponseSerializer(many=True)
+    total = serializers.IntegerField()
+    page = serializers.IntegerField()
+    page_size = serializers.IntegerField()
+    total_pages = serializers.IntegerField()
+    has_next = serializers.BooleanField()
+    has_previous = serializers.BooleanField()
+
+
+class CursorPaginatedProductCardResponseSerializer(serializers.Serializer):
+    """Keyset paginated product card response serializer."""
+    items = ProductCardResponseSerializer(many=True)
+    page_size = serializers.IntegerField()
+    next_cursor = serializers.CharField(allow_null=True)
+    has_next = serializers.BooleanField()
+    total = serializers.IntegerField(allow_null=True)
+
+
+class FacetValueSerializer(serializers.Serializer):
+    """Facet value serializer."""
+    value = serializers.CharField()
+    label = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class SubcategoryFacetSerializer(serializers.Serializer):
+    """Subcategory facet serializer."""
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class AttributeFacetSerializer(serializers.Serializer):
+    """Attribute facet serializer."""
+    key = serializers.CharField()
+    label = serializers.CharField()
+    type = serializers.CharField()
+    unit = serializers.CharField(allow_null=True)
+    values = FacetValueSerializer(many=True)
+    min = serializers.CharField(allow_null=True)
+    max = serializers.CharField(allow_null=True)
+
+
+class ProductFacetsResponseSerializer(serializers.Serializer):
+    """Product facets response serializer."""
+    total = serializers.IntegerField()
+    subcategories = SubcategoryFacetSerializer(many=True)
+    availability = FacetValueSerializer(many=True)
+    attributes = AttributeFacetSerializer(many=True)
+
+
+# Precompiled encoders with the same output as ``<Serializer>(instance).data``
+encode_product_response = compile_encoder(ProductResponseSerializer)
+encode_product_batch = compile_encoder(ProductBatchResponseSerializer)
+encode_paginated_products = compile_encoder(PaginatedProductResponseSerializer, mapping=True)
+encode_cursor_paginated_products = compile_encoder(
+    CursorPaginatedProductResponseSerializer, mapping=True
+)
+encode_paginated_product_cards = compile_encoder(
+    PaginatedProductCardResponseSerializer, mapping=True
+)
+encode_cursor_paginated_product_cards = compile_encoder(
+    CursorPaginatedProductCardResponseSerializer, mapping=True
+)
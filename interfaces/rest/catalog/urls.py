@@ -5,6 +5,8 @@ from interfaces.rest.catalog.views import (
     CategoryWithSubcategoriesListView,
     SubcategoryListByCategoryView,
     ProductListView,
+    ProductFacetsView,
+    ProductBatchView,
     ProductDetailView,
 )
 
@@ -21,5 +23,7 @@ urlpatterns = [
         name='subcategory-list-by-category',
     ),
     path('products', ProductListView.as_view(), name='product-list'),
+    path('products/facets', ProductFacetsView.as_view(), name='product-facets'),
+    path('products/batch', ProductBatchView.as_view(), name='product-batch'),
     path('products/<int:product_id>', ProductDetailView.as_view(), name='product-detail'),
 ]
@@ -1,142 +1,276 @@
-"""Catalog views."""
-from rest_framework.views import APIView
-from rest_framework.permissions import AllowAny
+"""Catalog views.
+
+Read-only endpoints are async views: under ASGI they wait on the database
+without holding a worker thread, so one process serves many requests at once.
+"""
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.views import View
 from rest_framework import status
 
 from src.application.catalog.use_cases import (
     ListCategoriesUseCase,
     ListCategoriesWithSubcategoriesUseCase,
+    ListCategoriesWithCountsUseCase,
     ListSubcategoriesByCategoryUseCase,
     ListProductsUseCase,
+    ListProductsByCursorUseCase,
+    ListProductCardsUseCase,
+    ListProductCardsByCursorUseCase,
+    GetProductFacetsUseCase,
     GetProductUseCase,
+    GetProductsBatchUseCase,
+)
+from src.application.catalog.dto import ListProductsRequest
+from src.application.catalog.ports import (
+    CategoryRepository, ProductRepository, ProductListingRepository
 )
-from src.application.catalog.ports import CategoryRepository, ProductRepository
 from src.infrastructure.db.repositories.catalog_repo import (
-    DjangoCategoryRepository, DjangoProductRepository
+    DjangoCategoryRepository, DjangoProductRepository, DjangoProductListingRepository
 )
-from src.domain.shared.exceptions import NotFoundError
+from src.infrastructure.cache.catalog_repo import CachedCategoryRepository
+from src.infrastructure.cache.versions import CATEGORY_VERSION, CATALOG_VERSION
+from src.domain.shared.exceptions import NotFoundError, ValidationError
 from interfaces.rest.catalog.serializers import (
     CategoryResponseSerializer,
     CategoryWithSubcategoriesResponseSerializer,
+    CategoryWithCountsResponseSerializer,
     SubcategoryResponseSerializer,
-    ProductResponseSerializer,
-    PaginatedProductResponseSerializer,
+    ProductFacetsResponseSerializer,
+    encode_product_response,
+    encode_product_batch,
+    encode_paginated_products,
+    encode_cursor_paginated_products,
+    encode_paginated_product_cards,
+    encode_cursor_paginated_product_cards,
 )
-from interfaces.rest.shared.responses import success_response, error_response
+from interfaces.rest.shared.responses import json_response, json_error_response
+from interfaces.rest.shared.conditional import conditional_get
+from interfaces.rest.shared.instrumentation import timed
 
 
 # Initialize dependencies
-_category_repo: CategoryRepository = DjangoCategoryRepository()
+_category_repo: CategoryRepository = CachedCategoryRepository(DjangoCategoryRepository())
 _product_repo: ProductRepository = DjangoProductRepository()
+_listing_repo: Optional[ProductListingRepository] = (
+    DjangoProductListingRepository(_product_repo.list_query)
+    if settings.PRODUCT_READ_MODEL_ENABLED else None
+)
 
 
-class CategoryListView(APIView):
+def _parse_list_products_request(query_params) -> ListProductsRequest:
+    """Build a ListProductsRequest from product list query parameters."""
+    category_id = query_params.get('category_id')
+    subcategory_id = query_params.get('subcategory_id')
+    subcategory_ids_param = query_params.get('subcategory_ids')
+    search = query_params.get('search')
+    availability = query_params.get('availability')
+    cursor = query_params.get('cursor')
+    include_total = query_params.get('include_total', '').lower() in ('true', '1', 'yes')
+    estimate_total = query_params.get('count') == 'estimate'
+    page = int(query_params.get('page', 1))
+    page_size = int(query_params.get('page_size', 20))
+    
+    # Parse spec filters (e.g., ?spec_material=leather&spec_strap_length_cm=110)
+    spec_filters = {}
+    for key, value in query_params.items():
+        if key.startswith('spec_'):
+            spec_key = key[5:]  # Remove 'spec_' prefix
+            spec_filters[spec_key] = value
+    
+    subcategory_ids = None
+    if subcategory_ids_param:
+        subcategory_ids = [
+            int(val) for val in subcategory_ids_param.split(',')
+            if val.strip().isdigit()
+        ]
+    elif subcategory_id:
+        subcategory_ids = [int(subcategory_id)]
+
+    return ListProductsRequest(
+        category_id=int(category_id) if category_id else None,
+        subcategory_ids=subcategory_ids,
+        search=search,
+        availability=availability,
+        spec_filters=spec_filters if spec_filters else None,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
+        estimate_total=estimate_total
+    )
+
+
+class CategoryListView(View):
     """Category list view."""
-    permission_classes = [AllowAny]
     
-    def get(self, request):
+    @conditional_get(CATEGORY_VERSION)
+    async def get(self, request):
         """List categories."""
         use_case = ListCategoriesUseCase(_category_repo)
-        categories = use_case.execute()
-        return success_response([
-            CategoryResponseSerializer(cat).data for cat in categories
-        ])
+        with timed('use_case'):
+            categories = await sync_to_async(use_case.execute)()
+        with timed('serialize'):
+            return json_response([
+                CategoryResponseSerializer(cat).data for cat in categories
+            ])
 
 
-class CategoryWithSubcategoriesListView(APIView):
+class CategoryWithSubcategoriesListView(View):
     """Category list with subcategories view."""
-    permission_classes = [AllowAny]
 
-    def get(self, request):
+    async def get(self, request):
+        """List categories with subcategories (?with_counts=true adds product counts)."""
+        if request.GET.get('with_counts', '').lower() in ('true', '1', 'yes'):
+            return await self._get_with_counts(request)
+        return await self._get_tree(request)
+
+    @conditional_get(CATEGORY_VERSION)
+    async def _get_tree(self, request):
         """List categories with subcategories."""
         use_case = ListCategoriesWithSubcategoriesUseCase(_category_repo)
-        categories = use_case.execute()
-        return success_response([
-            CategoryWithSubcategoriesResponseSerializer(cat).data
-            for cat in categories
-        ])
+        with timed('use_case'):
+            categories = await sync_to_async(use_case.execute)()
+        with timed('serialize'):
+            return json_response([
+                CategoryWithSubcategoriesResponseSerializer(cat).data
+                for cat in categories
+            ])
+
+    @conditional_get(CATEGORY_VERSION, CATALOG_VERSION)
+    async def _get_with_counts(self, request):
+        """List categories with subcategories and product counts."""
+        use_case = ListCategoriesWithCountsUseCase(_category_repo, _product_repo)
+        with timed('use_case'):
+            categories = await sync_to_async(use_case.execute)()
+        with timed('serialize'):
+            return json_response([
+                CategoryWithCountsResponseSerializer(cat).data
+                for cat in categories
+            ])
 
 
-class SubcategoryListByCategoryView(APIView):
+class SubcategoryListByCategoryView(View):
     """Subcategory list for a category view."""
-    permission_classes = [AllowAny]
 
-    def get(self, request, category_id: int):
+    @conditional_get(CATEGORY_VERSION)
+    async def get(self, request, category_id: int):
         """List subcategories for a category."""
         use_case = ListSubcategoriesByCategoryUseCase(_category_repo)
-        subcategories = use_case.execute(category_id)
-        return success_response([
-            SubcategoryResponseSerializer(sub).data for sub in subcategories
-        ])
+        with timed('use_case'):
+            subcategories = await sync_to_async(use_case.execute)(category_id)
+        with timed('serialize'):
+            return json_response([
+                SubcategoryResponseSerializer(sub).data for sub in subcategories
+            ])
 
 
-class ProductListView(APIView):
+class ProductListView(View):
     """Product list view."""
-    permission_classes = [AllowAny]
     
-    def get(self, request):
+    @conditional_get(CATALOG_VERSION)
+    async def get(self, request):
         """List products."""
-        from src.application.catalog.dto import ListProductsRequest
+        list_request = _parse_list_products_request(request.GET)
         
-        # Parse query parameters
-        category_id = request.query_params.get('category_id')
-        subcategory_id = request.query_params.get('subcategory_id')
-        subcategory_ids_param = request.query_params.get('subcategory_ids')
-        search = request.query_params.get('search')
-        availability = request.query_params.get('availability')
-        page = int(request.query_params.get('page', 1))
-        page_size = int(request.query_params.get('page_size', 20))
+        # ?view=card: grid cards without category, subcategories or specifications
+        card_view = request.GET.get('view') == 'card'
         
-        # Parse spec filters (e.g., ?spec_material=leather&spec_strap_length_cm=110)
-        spec_filters = {}
-        for key, value in request.query_params.items():
-            if key.startswith('spec_'):
-                spec_key = key[5:]  # Remove 'spec_' prefix
-                spec_filters[spec_key] = value
+        # Keyset mode: ?cursor= (empty for the first page), no COUNT unless asked
+        if list_request.cursor is not None:
+            if card_view:
+                use_case = ListProductCardsByCursorUseCase(_product_repo)
+                encode = encode_cursor_paginated_product_cards
+            else:
+                use_case = ListProductsByCursorUseCase(_product_repo, _category_repo)
+                encode = encode_cursor_paginated_products
+            try:
+                with timed('use_case'):
+                    cursor_result = await sync_to_async(use_case.execute)(list_request)
+            except ValidationError as e:
+                return json_error_response(str(e), status=status.HTTP_400_BAD_REQUEST)
+            with timed('serialize'):
+                return json_response(encode({
+                    'items': cursor_result.items,
+                    'page_size': cursor_result.page_size,
+                    'next_cursor': cursor_result.next_cursor,
+                    'has_next': cursor_result.has_next,
+                    'total': cursor_result.total
+                }))
         
-        subcategory_ids = None
-        if subcategory_ids_param:
-            subcategory_ids = [
-                int(val) for val in subcategory_ids_param.split(',')
-                if val.strip().isdigit()
-            ]
-        elif subcategory_id:
-            subcategory_ids = [int(subcategory_id)]
-
-        list_request = ListProductsRequest(
-            category_id=int(category_id) if category_id else None,
-            subcategory_ids=subcategory_ids,
-            search=search,
-            availability=availability,
-            spec_filters=spec_filters if spec_filters else None,
-            page=page,
-            page_size=page_size
-        )
+        if card_view:
+            use_case = ListProductCardsUseCase(_product_repo)
+            encode = encode_paginated_product_cards
+        else:
+            use_case = ListProductsUseCase(_product_repo, _category_repo, _listing_repo)
+            encode = encode_paginated_products
+        with timed('use_case'):
+            result = await sync_to_async(use_case.execute)(list_request)
         
-        use_case = ListProductsUseCase(_product_repo, _category_repo)
-        result = use_case.execute(list_request)
+        with timed('serialize'):
+            return json_response(encode({
+                'items': result.items,
+                'total': result.total,
+                'page': result.page,
+                'page_size': result.page_size,
+                'total_pages': result.total_pages,
+                'has_next': result.has_next,
+                'has_previous': result.has_previous
+            }))
+
+
+class ProductFacetsView(View):
+    """Product facets view."""
+    
+    @conditional_get(CATALOG_VERSION)
+    async def get(self, request):
+        """Get facet counts for the product list filters."""
+        list_request = _parse_list_products_request(request.GET)
+        use_case = GetProductFacetsUseCase(_product_repo)
+        with timed('use_case'):
+            facets = await sync_to_async(use_case.execute)(list_request)
+        with timed('serialize'):
+            return json_response(ProductFacetsResponseSerializer(facets).data)
+
+
+class ProductBatchView(View):
+    """Product details for several ids (e.g. cart, wishlist) in one request."""
+    
+    @conditional_get(CATALOG_VERSION)
+    async def get(self, request):
+        """Get products by ?ids=1,2,3 in request order."""
+        ids_param = request.GET.get('ids', '')
+        try:
+            product_ids = [int(val) for val in ids_param.split(',') if val.strip()]
+        except ValueError:
+            return json_error_response(
+                "ids must be a comma-separated list of integers",
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        return success_response(PaginatedProductResponseSerializer({
-            'items': result.items,
-            'total': result.total,
-            'page': result.page,
-            'page_size': result.page_size,
-            'total_pages': result.total_pages,
-            'has_next': result.has_next,
-            'has_previous': result.has_previous
-        }).data)
-
-
-class ProductDetailView(APIView):
+        try:
+            use_case = GetProductsBatchUseCase(_product_repo)
+            with timed('use_case'):
+                batch = await use_case.aexecute(product_ids)
+        except ValidationError as e:
+            return json_error_response(str(e), status=status.HTTP_400_BAD_REQUEST)
+        with timed('serialize'):
+            return json_response(encode_product_batch(batch))
+
+
+class ProductDetailView(View):
     """Product detail view."""
-    permission_classes = [AllowAny]
     
-    def get(self, request, product_id):
+    @conditional_get(CATALOG_VERSION)
+    async def get(self, request, product_id):
         """Get product by ID."""
         try:
-            use_case = GetProductUseCase(_product_repo, _category_repo)
-            product = use_case.execute(product_id)
-            return success_response(ProductResponseSerializer(product).data)
+            use_case = GetProductUseCase(_product_repo)
+            with timed('use_case'):
+                product = await use_case.aexecute(product_id)
+            with timed('serialize'):
+                return json_response(encode_product_response(product))
         except NotFoundError as e:
-            return error_response(str(e), status=status.HTTP_404_NOT_FOUND)
-
+            return json_error_response(str(e), status=status.HTTP_404_NOT_FOUND)
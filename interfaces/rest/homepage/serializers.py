@@ -1,5 +1,6 @@
 """Homepage serializers."""
 from rest_framework import serializers
+from interfaces.rest.shared.encoders import compile_encoder
 from src.application.homepage.dto import (
     ProductCard, HomeCarouselSection, HomePageResponse
 )
@@ -38,3 +39,6 @@ class HomePageResponseSerializer(serializers.Serializer):
     """Homepage response serializer."""
     sections = HomeCarouselSectionSerializer(many=True)
 
+
+# Precompiled encoders with the same output as ``<Serializer>(instance).data``
+encode_home_page = compile_encoder(HomePageResponseSerializer)
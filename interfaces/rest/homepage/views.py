@@ -1,6 +1,6 @@
 """Homepage views."""
-from rest_framework.views import APIView
-from rest_framework.permissions import AllowAny
+from asgiref.sync import sync_to_async
+from django.views import View
 from rest_framework import status
 
 from src.application.homepage.use_cases import GetHomePageSectionsUseCase
@@ -8,8 +8,13 @@ from src.application.homepage.ports import HomeSectionRepository, ProductCardRep
 from src.infrastructure.db.repositories.homepage_repo import (
     DjangoHomeSectionRepository, DjangoProductCardRepository
 )
-from interfaces.rest.homepage.serializers import HomePageResponseSerializer
-from interfaces.rest.shared.responses import success_response, error_response
+from src.infrastructure.cache.versions import HOMEPAGE_VERSION, CATALOG_VERSION
+from interfaces.rest.homepage.serializers import encode_home_page
+from interfaces.rest.shared.responses import json_response, json_error_response
+from interfaces.rest.shared.conditional import conditional_get
+from interfaces.rest.shared.instrumentation import timed
+from interfaces.rest.shared.renderers import FastJSONRenderer
+from interfaces.rest.shared.snapshots import RenderedSnapshot
 
 
 # Initialize dependencies
@@ -17,25 +22,37 @@ _home_section_repo: HomeSectionRepository = DjangoHomeSectionRepository()
 _product_card_repo: ProductCardRepository = DjangoProductCardRepository()
 
 
-class HomePageView(APIView):
-    """Homepage view."""
-    authentication_classes = []  # No authentication for public endpoints
-    permission_classes = [AllowAny]
+def _render_home_page() -> bytes:
+    """Build and render the homepage payload."""
+    use_case = GetHomePageSectionsUseCase(
+        _home_section_repo,
+        _product_card_repo
+    )
+    with timed('use_case'):
+        home_page = use_case.execute()
+    with timed('serialize'):
+        return FastJSONRenderer().render(encode_home_page(home_page))
+
+
+# Sections/items bump HOMEPAGE_VERSION; products, variants and their
+# subcategories bump CATALOG_VERSION
+_home_page_snapshot = RenderedSnapshot(
+    'homepage', _render_home_page, stamps=(HOMEPAGE_VERSION, CATALOG_VERSION)
+)
+
+
+class HomePageView(View):
+    """Homepage view (async; public, no authentication)."""
     
-    def get(self, request):
+    @conditional_get(HOMEPAGE_VERSION, CATALOG_VERSION)
+    async def get(self, request):
         """Get homepage sections."""
         try:
-            use_case = GetHomePageSectionsUseCase(
-                _home_section_repo,
-                _product_card_repo
-            )
-            response = use_case.execute()
-            return success_response(
-                HomePageResponseSerializer(response).data
-            )
+            # Pre-rendered JSON bytes from memory; only a rebuild hits the
+            # database, in a worker thread
+            return json_response(await sync_to_async(_home_page_snapshot.get)())
         except Exception as e:
-            return error_response(
+            return json_error_response(
                 str(e),
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-
@@ -0,0 +1,33 @@
+"""Metrics views."""
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views import View
+from rest_framework import status
+
+from src.infrastructure.metrics.collector import render
+from interfaces.rest.shared.responses import json_error_response
+
+
+class MetricsView(View):
+    """Prometheus scrape endpoint (text exposition format, all workers of this host)."""
+    
+    def get(self, request):
+        """Render current metrics; requires ``Authorization: Bearer <METRICS_TOKEN>``.
+        
+        Without a configured token the endpoint refuses every request.
+        """
+        token = settings.METRICS_TOKEN
+        if not token:
+            return json_error_response(
+                "Metrics are disabled until METRICS_TOKEN is set",
+                status=status.HTTP_403_FORBIDDEN
+            )
+        if not constant_time_compare(
+            request.headers.get('Authorization', ''), f'Bearer {token}'
+        ):
+            return json_error_response(
+                "Invalid or missing metrics token",
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+        return HttpResponse(render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,95 @@
+"""Per-request query counts and timings.
+
+While a request is being served, ``record_queries`` wraps its database
+connections so every SQL statement is recorded with its duration (async
+views share the request's connections with the threads running their
+queries), and views time their use case and serialization with ``timed``.
+``RequestInstrumentationMiddleware`` reports the result.
+"""
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from asgiref.local import Local
+from django.db import connections
+
+
+@dataclass
+class RequestMetrics:
+    """Queries and timings (seconds) recorded for one request."""
+    started_at: float = field(default_factory=time.perf_counter)
+    queries: List[Tuple[str, float]] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    
+    @property
+    def query_count(self) -> int:
+        return len(self.queries)
+    
+    @property
+    def db_time(self) -> float:
+        return sum(duration for _, duration in self.queries)
+    
+    @property
+    def total_time(self) -> float:
+        return time.perf_counter() - self.started_at
+
+
+_request_state = Local()
+
+
+def start_request() -> RequestMetrics:
+    """Start recording for the current request."""
+    metrics = _request_state.metrics = RequestMetrics()
+    return metrics
+
+
+def finish_request() -> Optional[RequestMetrics]:
+    """Stop recording for the current request and return what was recorded."""
+    metrics = getattr(_request_state, 'metrics', None)
+    _request_state.metrics = None
+    return metrics
+
+
+def current_metrics() -> Optional[RequestMetrics]:
+    """Metrics of the request being served, if any."""
+    return getattr(_request_state, 'metrics', None)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Add the time spent in the block to the current request's ``name`` timing."""
+    metrics = current_metrics()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[name] += time.perf_counter() - start
+
+
+def record_queries() -> ExitStack:
+    """Record the statements run on every connection until the stack is closed.
+    
+    Wrapping per request also covers connections opened before this module
+    was imported (persistent ``CONN_MAX_AGE`` connections, the test runner).
+    """
+    stack = ExitStack()
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(_record_query))
+    return stack
+
+
+def _record_query(execute, sql, params, many, context):
+    """Execute wrapper recording each statement run while serving a request."""
+    metrics = current_metrics()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries.append((sql, time.perf_counter() - start))
@@ -0,0 +1,137 @@
+"""Shared middleware."""
+import logging
+import time
+
+from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
+
+from src.infrastructure.db.routers import begin_replica_reads, end_replica_reads
+from src.infrastructure.metrics.collector import (
+    REQUESTS_IN_FLIGHT, REQUEST_DURATION, DB_QUERIES
+)
+from interfaces.rest.shared.instrumentation import (
+    start_request, finish_request, current_metrics, record_queries
+)
+
+
+logger = logging.getLogger('jasmine.requests')
+
+# Anything else is reported as OTHER to keep label values bounded
+_METHODS = frozenset({'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'})
+
+
+class RequestInstrumentationMiddleware(MiddlewareMixin):
+    """Report query count and timings of every request.
+    
+    Adds a ``Server-Timing`` header (db, use_case, serialize, total; shown
+    in the browser's network panel) and logs one ``key=value`` line per
+    request, with the fields also attached as ``extra={'request_metrics':
+    ...}`` for structured handlers. Requests running more than
+    ``SLOW_REQUEST_QUERY_COUNT`` queries or taking longer than
+    ``SLOW_REQUEST_MS`` are logged as warnings with every statement.
+    """
+    
+    def process_request(self, request):
+        start_request()
+        request._query_recorders = record_queries()
+    
+    def process_response(self, request, response):
+        recorders = getattr(request, '_query_recorders', None)
+        if recorders is not None:
+            recorders.close()
+        metrics = finish_request()
+        if metrics is None:
+            return response
+        
+        total_ms = metrics.total_time * 1000
+        db_ms = metrics.db_time * 1000
+        timings_ms = {name: seconds * 1000 for name, seconds in metrics.timings.items()}
+        
+        response['Server-Timing'] = ', '.join(
+            [f'db;dur={db_ms:.1f};desc="{metrics.query_count} queries"']
+            + [f'{name};dur={ms:.1f}' for name, ms in timings_ms.items()]
+            + [f'total;dur={total_ms:.1f}']
+        )
+        
+        fields = {
+            'method': request.method,
+            'path': request.path,
+            'route': request.resolver_match.view_name if request.resolver_match else None,
+            'status': response.status_code,
+            'queries': metrics.query_count,
+            'db_ms': round(db_ms, 1),
+            **{f'{name}_ms': round(ms, 1) for name, ms in timings_ms.items()},
+            'total_ms': round(total_ms, 1),
+        }
+        message = ' '.join(f'{key}={value}' for key, value in fields.items())
+        
+        if (
+            metrics.query_count > settings.SLOW_REQUEST_QUERY_COUNT
+            or total_ms > settings.SLOW_REQUEST_MS
+        ):
+            statements = '\n'.join(
+                f'  [{duration * 1000:.1f} ms] {sql}' for sql, duration in metrics.queries
+            )
+            logger.warning(
+                'slow request %s\n%s', message, statements,
+                extra={'request_metrics': fields}
+            )
+        else:
+            logger.info('request %s', message, extra={'request_metrics': fields})
+        return response
+
+
+class RequestMetricsMiddleware(MiddlewareMixin):
+    """Record Prometheus request metrics, scraped from ``/metrics``.
+    
+    Latency by URL name, method and status code, requests in flight, and
+    SQL queries by URL name (counted by ``RequestInstrumentationMiddleware``,
+    which must wrap this one).
+    """
+    
+    def process_request(self, request):
+        request._metrics_started_at = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc()
+    
+    def process_response(self, request, response):
+        started_at = getattr(request, '_metrics_started_at', None)
+        if started_at is None:
+            return response
+        REQUESTS_IN_FLIGHT.dec()
+        
+        match = request.resolver_match
+        route = match.url_name if match is not None and match.url_name else 'unmatched'
+        REQUEST_DURATION.observe(
+            time.perf_counter() - started_at,
+            route=route,
+            method=request.method if request.method in _METHODS else 'OTHER',
+            status=response.status_code
+        )
+        metrics = current_metrics()
+        if metrics is not None:
+            DB_QUERIES.inc(metrics.query_count, route=route)
+        return response
+
+
+class ReplicaStickinessMiddleware(MiddlewareMixin):
+    """Read-your-writes for clients of the read replica router.
+    
+    A request that writes sets a short-lived cookie; while it is present the
+    client's reads go to the primary, so it never sees a replica that has
+    not caught up with its own write.
+    """
+    cookie_name = 'db_primary'
+    
+    def process_request(self, request):
+        begin_replica_reads(pinned=self.cookie_name in request.COOKIES)
+    
+    def process_response(self, request, response):
+        if end_replica_reads():
+            response.set_cookie(
+                self.cookie_name,
+                '1',
+                max_age=settings.DATABASE_REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
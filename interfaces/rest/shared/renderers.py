@@ -0,0 +1,64 @@
+"""Shared renderers."""
+import dataclasses
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+
+class DataclassJSONEncoder(JSONEncoder):
+    """DRF JSON encoder that also encodes dataclass instances (e.g. response DTOs)."""
+    
+    def default(self, obj):
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+        return super().default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSON renderer backed by orjson, with the stdlib renderer as fallback.
+    
+    Produces the same bytes as DRF's JSONRenderer for compact output and
+    additionally encodes dataclasses. ``bytes`` data is treated as an already
+    encoded JSON document (e.g. from a cache) and returned unchanged.
+    Indented output (``Accept: application/json; indent=4``) and values
+    orjson cannot encode go through the stdlib encoder.
+    """
+    encoder_class = DataclassJSONEncoder
+    _default = staticmethod(DataclassJSONEncoder().default)
+    
+    # Compact, unescaped UTF-8 like DRF's defaults; UTC datetimes end in 'Z'
+    orjson_options = orjson.OPT_UTC_Z if orjson is not None else 0
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render `data` into JSON, returning a bytestring."""
+        if isinstance(data, bytes):
+            return data
+        if data is None:
+            return b''
+        
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        try:
+            ret = orjson.dumps(data, default=self._default, option=self.orjson_options)
+        except orjson.JSONEncodeError:
+            # e.g. non-string keys or integers beyond 64 bits; let the stdlib
+            # encoder decide
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        # Keep the output a strict JavaScript subset, like JSONRenderer
+        # (U+2028/U+2029 both start with these bytes in UTF-8)
+        if b'\xe2\x80' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -1,7 +1,13 @@
 """Shared response utilities."""
+from django.http import HttpResponse
 from rest_framework.response import Response
 from typing import Any, Dict
 
+from interfaces.rest.shared.renderers import FastJSONRenderer
+
+
+_json_renderer = FastJSONRenderer()
+
 
 def success_response(data: Any, status: int = 200) -> Response:
     """Create a success response."""
@@ -15,3 +21,20 @@ def error_response(message: str, status: int = 400, errors: Dict = None) -> Resp
         response_data['errors'] = errors
     return Response(response_data, status=status)
 
+
+
+def json_response(data: Any, status: int = 200) -> HttpResponse:
+    """Create a success response outside DRF (async views)."""
+    return HttpResponse(
+        _json_renderer.render(data),
+        status=status,
+        content_type=_json_renderer.media_type
+    )
+
+
+def json_error_response(message: str, status: int = 400, errors: Dict = None) -> HttpResponse:
+    """Create an error response outside DRF (async views)."""
+    response_data = {'error': message}
+    if errors:
+        response_data['errors'] = errors
+    return json_response(response_data, status=status)
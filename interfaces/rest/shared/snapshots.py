@@ -0,0 +1,95 @@
+"""Pre-rendered response payloads kept in memory between requests."""
+import threading
+import time
+from typing import Callable, Optional, Sequence, Tuple
+
+from django.core.cache import cache
+
+from src.infrastructure.cache.versions import VersionStamp
+from src.infrastructure.metrics.collector import CACHE_REQUESTS
+
+
+class RenderedSnapshot:
+    """Rendered JSON bytes of a read endpoint, rebuilt once per version change.
+    
+    The payload is held in process memory and shared between workers through
+    the Django cache, keyed by the version stamps it was built from. Rebuilds
+    are single-flight: within a process one thread rebuilds, and across
+    processes a cache lock lets one worker build while the others keep
+    serving their previous payload (or wait for the new one if they have
+    none yet).
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        build: Callable[[], bytes],
+        stamps: Sequence[VersionStamp],
+        timeout: int = 3600,
+        lock_timeout: int = 30
+    ):
+        self.name = name
+        self.build = build
+        self.stamps = stamps
+        self.timeout = timeout
+        self.lock_timeout = lock_timeout
+        self._lock = threading.Lock()
+        self._current: Optional[Tuple[str, bytes]] = None
+    
+    def get(self) -> bytes:
+        """Return the payload for the current versions."""
+        key = ':'.join(
+            [f'snapshot:{self.name}'] + [f'{stamp.name}={stamp.get()}' for stamp in self.stamps]
+        )
+        current = self._current
+        if current is not None and current[0] == key:
+            CACHE_REQUESTS.inc(cache=f'snapshot:{self.name}', result='hit')
+            return current[1]
+        
+        # Another thread is already rebuilding: keep serving the old payload
+        if not self._lock.acquire(blocking=current is None):
+            return current[1]
+        try:
+            current = self._current
+            if current is not None and current[0] == key:
+                return current[1]
+            
+            payload = self._load(key, stale=current[1] if current else None)
+            if payload is None:
+                # Another worker is building; the stale payload bridges the gap
+                return current[1]
+            self._current = (key, payload)
+            return payload
+        finally:
+            self._lock.release()
+    
+    def _load(self, key: str, stale: Optional[bytes]) -> Optional[bytes]:
+        """Fetch the shared payload or build it, at most one worker at a time.
+        
+        Returns None when another worker holds the build lock and ``stale``
+        can be served meanwhile.
+        """
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            payload = cache.get(key)
+            if payload is not None:
+                CACHE_REQUESTS.inc(cache=f'snapshot:{self.name}', result='hit')
+                return payload
+            
+            if cache.add(f'{key}:lock', 1, timeout=self.lock_timeout):
+                CACHE_REQUESTS.inc(cache=f'snapshot:{self.name}', result='miss')
+                try:
+                    payload = self.build()
+                    cache.set(key, payload, timeout=self.timeout)
+                    return payload
+                finally:
+                    cache.delete(f'{key}:lock')
+            
+            if stale is not None:
+                return None
+            if time.monotonic() >= deadline:
+                # The lock holder is gone or very slow; build without it
+                payload = self.build()
+                cache.set(key, payload, timeout=self.timeout)
+                return payload
+            time.sleep(0.05)
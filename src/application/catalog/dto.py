@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict
 from decimal import Decimal
 from datetime import datetime
+from src.domain.catalog.entities import Product, Category, Subcategory
 
 
 @dataclass
@@ -35,6 +36,20 @@ class CategoryWithSubcategoriesResponse:
     subcategories: List[SubcategoryResponse]
 
 
+@dataclass
+class SubcategoryWithCountsResponse(SubcategoryResponse):
+    """Subcategory response with product counts."""
+    product_count: int
+    availability_counts: Dict[str, int]
+
+
+@dataclass
+class CategoryWithCountsResponse(CategoryWithSubcategoriesResponse):
+    """Category response with subcategories (SubcategoryWithCountsResponse) and product counts."""
+    product_count: int
+    availability_counts: Dict[str, int]
+
+
 @dataclass
 class VariantProductPreview:
     """Variant product preview DTO."""
@@ -84,6 +99,88 @@ class ProductResponse:
     specifications_detailed: List[SpecificationDetail]  # Detailed list
 
 
+@dataclass
+class ProductAggregate:
+    """Everything a ProductResponse is built from, loaded together by the repository."""
+    product: Product
+    category: Optional[Category]
+    subcategories: List[Subcategory]  # In product.subcategory_ids order
+    variants: List[VariantProductPreview]  # Other group members, default first, then by id
+    specifications: Dict[str, str]
+    specifications_detailed: List[SpecificationDetail]
+
+
+@dataclass
+class ProductBatchResponse:
+    """Product details for a batch of ids."""
+    items: List[ProductResponse]  # In request order
+    missing_ids: List[int]  # Requested ids that do not exist
+
+
+@dataclass
+class ProductCardResponse:
+    """Product card DTO for grid listings (no category or specifications)."""
+    id: int
+    name: str
+    brand: Optional[str]
+    price: str  # Decimal as string
+    price_new: Optional[str]
+    price_old: Optional[str]
+    currency: str
+    availability: str
+    image: Optional[str]
+    color_name: Optional[str]
+    color_palette: Optional[str]
+
+
+@dataclass
+class FacetValue:
+    """Facet value with the number of matching products."""
+    value: str
+    label: str
+    count: int
+
+
+@dataclass
+class SubcategoryFacet:
+    """Subcategory facet."""
+    id: int
+    name: str
+    count: int
+
+
+@dataclass
+class AttributeFacet:
+    """Facet for a filterable attribute.
+    
+    TEXT, BOOLEAN and SELECT attributes fill ``values``; NUMBER attributes
+    fill ``min``/``max``.
+    """
+    key: str
+    label: str
+    type: str
+    unit: Optional[str]
+    values: List[FacetValue]
+    min: Optional[str]
+    max: Optional[str]
+
+
+@dataclass
+class ProductFacetsResponse:
+    """Facet counts for a filtered product listing."""
+    total: int
+    subcategories: List[SubcategoryFacet]
+    availability: List[FacetValue]
+    attributes: List[AttributeFacet]
+
+
+@dataclass
+class CategoryProductCounts:
+    """Product counts per availability for every category and subcategory with products."""
+    categories: Dict[int, Dict[str, int]]
+    subcategories: Dict[int, Dict[str, int]]
+
+
 @dataclass
 class ListProductsRequest:
     """List products request DTO."""
@@ -94,4 +191,7 @@ class ListProductsRequest:
     spec_filters: Optional[Dict[str, str]] = None
     page: int = 1
     page_size: int = 20
+    cursor: Optional[str] = None  # Keyset mode; empty string means first page
+    include_total: bool = False  # Only used in keyset mode
+    estimate_total: bool = False  # Allow a planner estimate for broad queries
 
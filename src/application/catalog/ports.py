@@ -5,6 +5,10 @@ from src.domain.catalog.entities import (
     Category, Subcategory, Product, VariantGroup, Attribute,
     AttributeOption, ProductAttributeValue
 )
+from src.application.catalog.dto import (
+    ProductFacetsResponse, ProductResponse, ProductCardResponse, ProductAggregate,
+    CategoryProductCounts
+)
 
 
 class CategoryRepository(ABC):
@@ -30,6 +34,16 @@ class CategoryRepository(ABC):
         """Get subcategories by category ID."""
         pass
 
+    @abstractmethod
+    def get_all_subcategories(self) -> List[Subcategory]:
+        """Get all subcategories ordered by name."""
+        pass
+    
+    @abstractmethod
+    def get_tree(self) -> List[Tuple[Category, List[Subcategory]]]:
+        """Get all categories with their subcategories ordered by name."""
+        pass
+
 
 class ProductRepository(ABC):
     """Product repository interface."""
@@ -43,9 +57,83 @@ class ProductRepository(ABC):
         availability: Optional[str] = None,
         spec_filters: Optional[Dict[str, str]] = None,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        estimate_total: bool = False
     ) -> Tuple[List[Product], int]:
-        """Get all products with filters and pagination."""
+        """Get all products with filters and pagination.
+        
+        With ``estimate_total`` the total may be an approximation for very
+        broad queries.
+        """
+        pass
+    
+    @abstractmethod
+    def get_page_after(
+        self,
+        cursor: Optional[str] = None,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+        estimate_total: bool = False
+    ) -> Tuple[List[Product], Optional[str], Optional[int]]:
+        """Get products after an opaque cursor (keyset pagination).
+        
+        Returns:
+            Tuple of (products, next_cursor, total). ``next_cursor`` is None on
+            the last page and ``total`` is None unless ``include_total`` is set.
+        """
+        pass
+    
+    @abstractmethod
+    def get_cards(
+        self,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        estimate_total: bool = False
+    ) -> Tuple[List[ProductCardResponse], int]:
+        """Get a page of product cards; same filters and ordering as get_all."""
+        pass
+    
+    @abstractmethod
+    def get_cards_after(
+        self,
+        cursor: Optional[str] = None,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+        estimate_total: bool = False
+    ) -> Tuple[List[ProductCardResponse], Optional[str], Optional[int]]:
+        """Get product cards after a cursor; same semantics as get_page_after."""
+        pass
+    
+    @abstractmethod
+    def get_facets(
+        self,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None
+    ) -> ProductFacetsResponse:
+        """Get subcategory, availability and attribute facets for the filtered products."""
+        pass
+    
+    @abstractmethod
+    def get_category_counts(self) -> CategoryProductCounts:
+        """Get product counts per category and per subcategory, split by availability."""
         pass
     
     @abstractmethod
@@ -53,6 +141,26 @@ class ProductRepository(ABC):
         """Get product by ID."""
         pass
     
+    @abstractmethod
+    def get_aggregates(self, product_ids: List[int]) -> Dict[int, ProductAggregate]:
+        """Load full product aggregates in a fixed number of queries.
+        
+        The query count does not depend on how many products, subcategories,
+        variant siblings or attribute values are involved. Missing IDs are
+        absent from the result.
+        """
+        pass
+    
+    @abstractmethod
+    async def aget_aggregates(self, product_ids: List[int]) -> Dict[int, ProductAggregate]:
+        """Async version of ``get_aggregates`` for async request paths."""
+        pass
+    
+    @abstractmethod
+    def get_by_ids(self, product_ids: List[int]) -> List[Product]:
+        """Get products by IDs, in ascending id order. Missing IDs are skipped."""
+        pass
+    
     @abstractmethod
     def get_variant_group_products(
         self,
@@ -74,6 +182,52 @@ class ProductRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_specifications_bulk(
+        self,
+        product_ids: List[int]
+    ) -> Dict[int, Tuple[Dict[str, str], List[Dict]]]:
+        """Get specifications for many products at once.
+        
+        Returns:
+            Dict mapping product_id to (simple_record, detailed_list).
+            Products without attribute values map to empty results.
+        """
+        pass
+
+
+class ProductListingRepository(ABC):
+    """Read model holding pre-assembled product list payloads."""
+    
+    @abstractmethod
+    def get_page(
+        self,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        estimate_total: bool = False
+    ) -> Optional[Tuple[List[ProductResponse], int]]:
+        """Get a page of list payloads with the same semantics as ProductRepository.get_all.
+        
+        Returns None when a product on the page has no payload yet, so the
+        caller can assemble the page from the source tables instead.
+        """
+        pass
+    
+    @abstractmethod
+    def save(self, products: List[ProductResponse]) -> None:
+        """Store (insert or replace) list payloads."""
+        pass
+    
+    @abstractmethod
+    def delete(self, product_ids: List[int]) -> None:
+        """Remove list payloads."""
+        pass
+
 
 class AttributeRepository(ABC):
     """Attribute repository interface."""
@@ -1,29 +1,38 @@
 """Catalog use cases."""
-from typing import List
-from src.domain.shared.exceptions import NotFoundError
-from src.domain.catalog.entities import Product
-from src.application.catalog.ports import CategoryRepository, ProductRepository
+from typing import List, Dict, Optional, Tuple
+from src.domain.shared.exceptions import NotFoundError, ValidationError
+from src.domain.catalog.entities import Product, Category, Subcategory
+from src.domain.shared.types import Availability
+from src.application.catalog.ports import (
+    CategoryRepository, ProductRepository, ProductListingRepository
+)
 from src.application.catalog.dto import (
     CategoryResponse,
     CategoryWithSubcategoriesResponse,
+    CategoryWithCountsResponse,
     SubcategoryResponse,
+    SubcategoryWithCountsResponse,
     ProductResponse,
+    ProductBatchResponse,
+    ProductCardResponse,
+    ProductAggregate,
     VariantProductPreview,
+    SpecificationDetail,
+    ProductFacetsResponse,
     ListProductsRequest,
 )
-from src.application.shared.pagination import PaginatedResult
+from src.application.shared.pagination import PaginatedResult, CursorPaginatedResult
 
 
-def _product_to_response(
-    product_repo: ProductRepository,
-    category_repo: CategoryRepository,
-    product: Product
+def _build_product_response(
+    product: Product,
+    category: Optional[Category],
+    subcategories: List[Subcategory],
+    variants: List[VariantProductPreview],
+    specs_simple: Dict[str, str],
+    specs_detailed: List[SpecificationDetail]
 ) -> ProductResponse:
-    """Build ProductResponse from domain entity with related data."""
-    specs_simple, specs_detailed = product_repo.get_specifications(product.id)
-    
-    # Get category and subcategories
-    category = category_repo.get_by_id(product.category_id) if product.category_id else None
+    """Build ProductResponse from domain entities and already loaded related data."""
     category_response = CategoryResponse(
         id=category.id,
         name=category.name,
@@ -31,40 +40,17 @@ def _product_to_response(
         created_at=category.created_at
     ) if category else None
     
-    subcategory_responses: List[SubcategoryResponse] = []
-    for subcategory_id in product.subcategory_ids:
-        subcategory = category_repo.get_subcategory_by_id(subcategory_id)
-        if subcategory:
-            subcategory_responses.append(SubcategoryResponse(
-                id=subcategory.id,
-                category_id=subcategory.category_id,
-                name=subcategory.name,
-                slug=subcategory.slug,
-                description=subcategory.description,
-                created_at=subcategory.created_at
-            ))
-    
-    # Get variant group products if product belongs to a variant group
-    variant_previews = []
-    if product.variant_group_id:
-        variant_products = product_repo.get_variant_group_products(
-            product.variant_group_id,
-            exclude_product_id=product.id
+    subcategory_responses = [
+        SubcategoryResponse(
+            id=subcategory.id,
+            category_id=subcategory.category_id,
+            name=subcategory.name,
+            slug=subcategory.slug,
+            description=subcategory.description,
+            created_at=subcategory.created_at
         )
-        # Products are already ordered by repository (default first, then by id)
-        
-        variant_previews = [
-            VariantProductPreview(
-                id=v.id,
-                name=v.name,
-                price=str(v.price),
-                availability=v.availability.value,
-                image=v.variant_image,
-                color_name=v.variant_color_name,
-                color_palette=v.variant_color_palette
-            )
-            for v in variant_products
-        ]
+        for subcategory in subcategories
+    ]
     
     return ProductResponse(
         id=product.id,
@@ -85,12 +71,64 @@ def _product_to_response(
         variant_image=product.variant_image,
         created_at=product.created_at,
         updated_at=product.updated_at,
-        variants=variant_previews,
+        variants=variants,
         specifications=specs_simple,
         specifications_detailed=specs_detailed
     )
 
 
+def _aggregate_to_response(aggregate: ProductAggregate) -> ProductResponse:
+    """Build the detail ProductResponse (with variants) from a product aggregate."""
+    return _build_product_response(
+        aggregate.product,
+        aggregate.category,
+        aggregate.subcategories,
+        aggregate.variants,
+        aggregate.specifications,
+        aggregate.specifications_detailed
+    )
+
+
+def _product_to_response(
+    category_repo: CategoryRepository,
+    product: Product,
+    specifications: Tuple[Dict[str, str], List[SpecificationDetail]]
+) -> ProductResponse:
+    """Build a list-view ProductResponse (no variants) from domain entity.
+    
+    Category and subcategories are resolved through ``category_repo``.
+    """
+    category = category_repo.get_by_id(product.category_id) if product.category_id else None
+    
+    subcategories: List[Subcategory] = []
+    for subcategory_id in product.subcategory_ids:
+        subcategory = category_repo.get_subcategory_by_id(subcategory_id)
+        if subcategory:
+            subcategories.append(subcategory)
+    
+    specs_simple, specs_detailed = specifications
+    return _build_product_response(
+        product, category, subcategories, [], specs_simple, specs_detailed
+    )
+
+
+def _products_to_list_responses(
+    product_repo: ProductRepository,
+    category_repo: CategoryRepository,
+    products: List[Product]
+) -> List[ProductResponse]:
+    """Build list-view ProductResponses (no variants) for a page of products."""
+    # Load specifications for the whole page at once
+    specifications = product_repo.get_specifications_bulk(
+        [product.id for product in products]
+    )
+    
+    return [
+        _product_to_response(category_repo, product, specifications[product.id])
+        for product in products
+    ]
+
+
 class ListCategoriesUseCase:
     """List categories use case."""
     
@@ -141,13 +179,9 @@ class ListCategoriesWithSubcategoriesUseCase:
 
     def execute(self) -> List[CategoryWithSubcategoriesResponse]:
         """Execute list categories with subcategories."""
-        categories = self.category_repo.get_all()
         results: List[CategoryWithSubcategoriesResponse] = []
 
-        for category in categories:
-            subcategories = self.category_repo.get_subcategories_by_category(
-                category.id
-            )
+        for category, subcategories in self.category_repo.get_tree():
             results.append(CategoryWithSubcategoriesResponse(
                 id=category.id,
                 name=category.name,
@@ -169,75 +203,88 @@ class ListCategoriesWithSubcategoriesUseCase:
         return results
 
 
+class ListCategoriesWithCountsUseCase:
+    """List categories with subcategories and their product counts."""
+    
+    def __init__(self, category_repo: CategoryRepository, product_repo: ProductRepository):
+        self.category_repo = category_repo
+        self.product_repo = product_repo
+    
+    def execute(self) -> List[CategoryWithCountsResponse]:
+        """Execute list categories with counts (zero for nodes without products)."""
+        counts = self.product_repo.get_category_counts()
+        
+        def availability_counts(node_counts: Optional[Dict[str, int]]) -> Dict[str, int]:
+            node_counts = node_counts or {}
+            return {
+                availability.value: node_counts.get(availability.value, 0)
+                for availability in Availability
+            }
+        
+        results: List[CategoryWithCountsResponse] = []
+        for category, subcategories in self.category_repo.get_tree():
+            category_counts = availability_counts(counts.categories.get(category.id))
+            subcategory_responses = []
+            for sub in subcategories:
+                subcategory_counts = availability_counts(counts.subcategories.get(sub.id))
+                subcategory_responses.append(SubcategoryWithCountsResponse(
+                    id=sub.id,
+                    category_id=sub.category_id,
+                    name=sub.name,
+                    slug=sub.slug,
+                    description=sub.description,
+                    created_at=sub.created_at,
+                    product_count=sum(subcategory_counts.values()),
+                    availability_counts=subcategory_counts
+                ))
+            results.append(CategoryWithCountsResponse(
+                id=category.id,
+                name=category.name,
+                slug=category.slug,
+                created_at=category.created_at,
+                subcategories=subcategory_responses,
+                product_count=sum(category_counts.values()),
+                availability_counts=category_counts
+            ))
+        
+        return results
+
+
 class ListProductsUseCase:
     """List products use case."""
     
-    def __init__(self, product_repo: ProductRepository, category_repo: CategoryRepository):
+    def __init__(
+        self,
+        product_repo: ProductRepository,
+        category_repo: CategoryRepository,
+        listing_repo: Optional[ProductListingRepository] = None
+    ):
         self.product_repo = product_repo
         self.category_repo = category_repo
+        self.listing_repo = listing_repo
     
     def execute(self, request: ListProductsRequest) -> PaginatedResult[ProductResponse]:
         """Execute list products."""
-        products, total = self.product_repo.get_all(
+        filters = dict(
             category_id=request.category_id,
             subcategory_ids=request.subcategory_ids,
             search=request.search,
             availability=request.availability,
             spec_filters=request.spec_filters,
             page=request.page,
-            page_size=request.page_size
+            page_size=request.page_size,
+            estimate_total=request.estimate_total
         )
         
-        # Convert to response DTOs (without variants for list view - only in detail)
-        product_responses = []
-        for product in products:
-            specs_simple, specs_detailed = self.product_repo.get_specifications(product.id)
-            
-            # Get category and subcategories
-            category = self.category_repo.get_by_id(product.category_id) if product.category_id else None
-            category_response = CategoryResponse(
-                id=category.id,
-                name=category.name,
-                slug=category.slug,
-                created_at=category.created_at
-            ) if category else None
-            
-            subcategory_responses: List[SubcategoryResponse] = []
-            for subcategory_id in product.subcategory_ids:
-                subcategory = self.category_repo.get_subcategory_by_id(subcategory_id)
-                if subcategory:
-                    subcategory_responses.append(SubcategoryResponse(
-                        id=subcategory.id,
-                        category_id=subcategory.category_id,
-                        name=subcategory.name,
-                        slug=subcategory.slug,
-                        description=subcategory.description,
-                        created_at=subcategory.created_at
-                    ))
-            
-            product_responses.append(ProductResponse(
-                id=product.id,
-                name=product.name,
-                brand=product.brand,
-                price=str(product.price),
-                price_new=str(product.price_new) if product.price_new else None,
-                price_old=str(product.price_old) if product.price_old else None,
-                availability=product.availability.value,
-                category_id=product.category_id,
-                subcategory_ids=product.subcategory_ids,
-                category=category_response,
-                subcategories=subcategory_responses,
-                currency=product.currency.value,
-                variant_group_id=product.variant_group_id,
-                variant_color_name=product.variant_color_name,
-                variant_color_palette=product.variant_color_palette,
-                variant_image=product.variant_image,
-                created_at=product.created_at,
-                updated_at=product.updated_at,
-                variants=[],  # No variants in list view
-                specifications=specs_simple,
-                specifications_detailed=specs_detailed
-            ))
+        # Serve pre-assembled payloads when the read model covers the page
+        listing_page = self.listing_repo.get_page(**filters) if self.listing_repo else None
+        if listing_page is not None:
+            product_responses, total = listing_page
+        else:
+            products, total = self.product_repo.get_all(**filters)
+            product_responses = _products_to_list_responses(
+                self.product_repo, self.category_repo, products
+            )
         
         total_pages = (total + request.page_size - 1) // request.page_size
         
@@ -250,17 +297,205 @@ class ListProductsUseCase:
         )
 
 
-class GetProductUseCase:
-    """Get product use case."""
+class RefreshProductListingsUseCase:
+    """Rebuild read-model list payloads for the given products."""
+    
+    def __init__(
+        self,
+        product_repo: ProductRepository,
+        category_repo: CategoryRepository,
+        listing_repo: ProductListingRepository
+    ):
+        self.product_repo = product_repo
+        self.category_repo = category_repo
+        self.listing_repo = listing_repo
+    
+    def execute(self, product_ids: List[int]) -> int:
+        """Execute refresh; returns the number of payloads written."""
+        products = self.product_repo.get_by_ids(product_ids)
+        self.listing_repo.save(
+            _products_to_list_responses(self.product_repo, self.category_repo, products)
+        )
+        
+        # Products that no longer exist lose their payload
+        missing = set(product_ids) - {product.id for product in products}
+        if missing:
+            self.listing_repo.delete(sorted(missing))
+        return len(products)
+
+
+class ListProductsByCursorUseCase:
+    """List products with keyset (cursor) pagination."""
     
     def __init__(self, product_repo: ProductRepository, category_repo: CategoryRepository):
         self.product_repo = product_repo
         self.category_repo = category_repo
     
+    def execute(self, request: ListProductsRequest) -> CursorPaginatedResult[ProductResponse]:
+        """Execute list products after request.cursor."""
+        products, next_cursor, total = self.product_repo.get_page_after(
+            cursor=request.cursor or None,
+            category_id=request.category_id,
+            subcategory_ids=request.subcategory_ids,
+            search=request.search,
+            availability=request.availability,
+            spec_filters=request.spec_filters,
+            page_size=request.page_size,
+            include_total=request.include_total,
+            estimate_total=request.estimate_total
+        )
+        
+        return CursorPaginatedResult(
+            items=_products_to_list_responses(
+                self.product_repo, self.category_repo, products
+            ),
+            page_size=request.page_size,
+            next_cursor=next_cursor,
+            total=total
+        )
+
+
+class ListProductCardsUseCase:
+    """List product cards (grid view) with offset pagination."""
+    
+    def __init__(self, product_repo: ProductRepository):
+        self.product_repo = product_repo
+    
+    def execute(self, request: ListProductsRequest) -> PaginatedResult[ProductCardResponse]:
+        """Execute list product cards."""
+        cards, total = self.product_repo.get_cards(
+            category_id=request.category_id,
+            subcategory_ids=request.subcategory_ids,
+            search=request.search,
+            availability=request.availability,
+            spec_filters=request.spec_filters,
+            page=request.page,
+            page_size=request.page_size,
+            estimate_total=request.estimate_total
+        )
+        
+        total_pages = (total + request.page_size - 1) // request.page_size
+        
+        return PaginatedResult(
+            items=cards,
+            total=total,
+            page=request.page,
+            page_size=request.page_size,
+            total_pages=total_pages
+        )
+
+
+class ListProductCardsByCursorUseCase:
+    """List product cards (grid view) with keyset (cursor) pagination."""
+    
+    def __init__(self, product_repo: ProductRepository):
+        self.product_repo = product_repo
+    
+    def execute(self, request: ListProductsRequest) -> CursorPaginatedResult[ProductCardResponse]:
+        """Execute list product cards after request.cursor."""
+        cards, next_cursor, total = self.product_repo.get_cards_after(
+            cursor=request.cursor or None,
+            category_id=request.category_id,
+            subcategory_ids=request.subcategory_ids,
+            search=request.search,
+            availability=request.availability,
+            spec_filters=request.spec_filters,
+            page_size=request.page_size,
+            include_total=request.include_total,
+            estimate_total=request.estimate_total
+        )
+        
+        return CursorPaginatedResult(
+            items=cards,
+            page_size=request.page_size,
+            next_cursor=next_cursor,
+            total=total
+        )
+
+
+class GetProductFacetsUseCase:
+    """Get facet counts for a filtered product listing."""
+    
+    def __init__(self, product_repo: ProductRepository):
+        self.product_repo = product_repo
+    
+    def execute(self, request: ListProductsRequest) -> ProductFacetsResponse:
+        """Execute get facets (paging fields of the request are ignored)."""
+        return self.product_repo.get_facets(
+            category_id=request.category_id,
+            subcategory_ids=request.subcategory_ids,
+            search=request.search,
+            availability=request.availability,
+            spec_filters=request.spec_filters
+        )
+
+
+class GetProductUseCase:
+    """Get product use case."""
+    
+    def __init__(self, product_repo: ProductRepository):
+        self.product_repo = product_repo
+    
     def execute(self, product_id: int) -> ProductResponse:
         """Execute get product."""
-        product = self.product_repo.get_by_id(product_id)
-        if not product:
+        aggregate = self.product_repo.get_aggregates([product_id]).get(product_id)
+        if not aggregate:
             raise NotFoundError("Product not found")
         
-        return _product_to_response(self.product_repo, self.category_repo, product)
+        return _aggregate_to_response(aggregate)
+    
+    async def aexecute(self, product_id: int) -> ProductResponse:
+        """Execute get product (async)."""
+        aggregate = (await self.product_repo.aget_aggregates([product_id])).get(product_id)
+        if not aggregate:
+            raise NotFoundError("Product not found")
+        
+        return _aggregate_to_response(aggregate)
+
+
+class GetProductsBatchUseCase:
+    """Get product details for several products at once."""
+    
+    MAX_IDS = 50
+    
+    def __init__(self, product_repo: ProductRepository):
+        self.product_repo = product_repo
+    
+    def execute(self, product_ids: List[int]) -> ProductBatchResponse:
+        """Execute get products; duplicate ids are returned once."""
+        product_ids = self._validate(product_ids)
+        return self._to_response(product_ids, self.product_repo.get_aggregates(product_ids))
+    
+    async def aexecute(self, product_ids: List[int]) -> ProductBatchResponse:
+        """Execute get products (async)."""
+        product_ids = self._validate(product_ids)
+        return self._to_response(
+            product_ids, await self.product_repo.aget_aggregates(product_ids)
+        )
+    
+    def _validate(self, product_ids: List[int]) -> List[int]:
+        """Deduplicate ids keeping request order and enforce the batch size."""
+        product_ids = list(dict.fromkeys(product_ids))
+        if not product_ids:
+            raise ValidationError("At least one product id is required")
+        if len(product_ids) > self.MAX_IDS:
+            raise ValidationError(f"At most {self.MAX_IDS} product ids are allowed")
+        return product_ids
+    
+    def _to_response(
+        self,
+        product_ids: List[int],
+        aggregates: Dict[int, ProductAggregate]
+    ) -> ProductBatchResponse:
+        """Order loaded aggregates as requested and report the missing ids."""
+        return ProductBatchResponse(
+            items=[
+                _aggregate_to_response(aggregates[product_id])
+                for product_id in product_ids
+                if product_id in aggregates
+            ],
+            missing_ids=[
+                product_id for product_id in product_ids
+                if product_id not in aggregates
+            ]
+        )
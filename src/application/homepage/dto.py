@@ -1,6 +1,14 @@
 """Homepage DTOs."""
 from dataclasses import dataclass
 from typing import Optional, List
+from src.domain.catalog.entities import Product
+
+
+@dataclass
+class FeaturedProduct:
+    """Product shown on the homepage with its primary image."""
+    product: Product
+    image_url: Optional[str]  # First variant image by sort_order
 
 
 @dataclass
@@ -2,7 +2,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict
 from src.domain.homepage.entities import HomeSection, HomeSectionItem
-from src.domain.catalog.entities import Product
+from src.application.homepage.dto import FeaturedProduct
 
 
 class HomeSectionRepository(ABC):
@@ -19,10 +19,11 @@ class HomeSectionRepository(ABC):
         section_ids: List[int]
     ) -> Dict[int, List[HomeSectionItem]]:
         """
-        Get all section items for given sections.
+        Get the items to render for given sections.
         
         Returns:
-            Dict mapping section_id to list of items ordered by sort_order
+            Dict mapping section_id to at most ``product_count`` items,
+            ordered by sort_order
         """
         pass
 
@@ -34,12 +35,12 @@ class ProductCardRepository(ABC):
     def get_product_cards(
         self,
         product_ids: List[int]
-    ) -> List[Product]:
+    ) -> List[FeaturedProduct]:
         """
-        Get products by IDs in the same order as provided.
+        Get products with their primary images by IDs in the same order as provided.
         
         Returns:
-            List of Product entities (may be shorter if some IDs don't exist)
+            List of FeaturedProduct (may be shorter if some IDs don't exist)
         """
         pass
 
@@ -1,5 +1,5 @@
 """Homepage use cases."""
-from typing import List
+from typing import List, Optional
 from src.domain.homepage.entities import HomeSection, HomeSectionItem
 from src.domain.homepage.rules import get_items_to_render, filter_unavailable_products
 from src.application.homepage.ports import HomeSectionRepository, ProductCardRepository
@@ -30,7 +30,8 @@ class GetHomePageSectionsUseCase:
         
         section_ids = [section.id for section in sections]
         
-        # Fetch all section items in one query
+        # Fetch the items each section renders in one query (already ordered
+        # and limited to product_count)
         section_items_map = self.home_section_repo.get_section_items(section_ids)
         
         # Collect all product IDs in order
@@ -39,17 +40,16 @@ class GetHomePageSectionsUseCase:
         
         for section in sections:
             items = section_items_map.get(section.id, [])
-            # Sort items by sort_order
-            sorted_items = sorted(items, key=lambda x: x.sort_order)
-            product_ids = [item.product_id for item in sorted_items]
+            product_ids = [item.product_id for item in items]
             section_product_ids_map[section.id] = product_ids
             all_product_ids.extend(product_ids)
         
-        # Fetch all products in one query
-        products = self.product_card_repo.get_product_cards(all_product_ids)
+        # Fetch all products with their primary images in one query
+        featured_products = self.product_card_repo.get_product_cards(all_product_ids)
         
-        # Create product lookup map
-        product_map = {product.id: product for product in products}
+        # Create product and image lookup maps
+        product_map = {item.product.id: item.product for item in featured_products}
+        image_urls = {item.product.id: item.image_url for item in featured_products}
         
         # Build response sections
         response_sections = []
@@ -77,7 +77,7 @@ class GetHomePageSectionsUseCase:
             
             # Convert to ProductCard DTOs
             product_cards = [
-                self._to_product_card(product)
+                self._to_product_card(product, image_urls.get(product.id))
                 for product in products_to_render
             ]
             
@@ -96,11 +96,8 @@ class GetHomePageSectionsUseCase:
         
         return HomePageResponse(sections=response_sections)
     
-    def _to_product_card(self, product: Product) -> ProductCard:
+    def _to_product_card(self, product: Product, image_url: Optional[str]) -> ProductCard:
         """Convert Product entity to ProductCard DTO."""
-        # Get image URL from repository (attached as temporary attribute)
-        image_url = getattr(product, '_image_url', None)
-        
         return ProductCard(
             id=product.id,
             name=product.name,
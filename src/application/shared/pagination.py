@@ -1,6 +1,6 @@
 """Pagination utilities."""
 from dataclasses import dataclass
-from typing import List, TypeVar, Generic
+from typing import List, Optional, TypeVar, Generic
 
 T = TypeVar('T')
 
@@ -24,3 +24,16 @@ class PaginatedResult(Generic[T]):
         """Check if there's a previous page."""
         return self.page > 1
 
+
+@dataclass
+class CursorPaginatedResult(Generic[T]):
+    """Keyset paginated result."""
+    items: List[T]
+    page_size: int
+    next_cursor: Optional[str]
+    total: Optional[int] = None
+    
+    @property
+    def has_next(self) -> bool:
+        """Check if there's a next page."""
+        return self.next_cursor is not None
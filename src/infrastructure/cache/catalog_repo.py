@@ -0,0 +1,88 @@
+"""Cached catalog repositories."""
+from typing import Optional, List, Dict, NamedTuple, Tuple
+
+from src.domain.catalog.entities import Category, Subcategory
+from src.application.catalog.ports import CategoryRepository
+from src.infrastructure.cache.versions import VersionStamp, CATEGORY_VERSION
+
+
+class _CategorySnapshot(NamedTuple):
+    """Immutable in-memory copy of the category tree."""
+    version: int
+    categories: List[Category]
+    tree: List[Tuple[Category, List[Subcategory]]]
+    categories_by_id: Dict[int, Category]
+    subcategories_by_id: Dict[int, Subcategory]
+    subcategories_by_category: Dict[int, List[Subcategory]]
+
+
+class CachedCategoryRepository(CategoryRepository):
+    """Category repository decorator holding all categories in memory.
+    
+    The whole tree is reloaded from the wrapped repository whenever the
+    category version stamp changes.
+    """
+    
+    def __init__(
+        self,
+        inner: CategoryRepository,
+        version: VersionStamp = CATEGORY_VERSION
+    ):
+        self.inner = inner
+        self.version = version
+        self._snapshot: Optional[_CategorySnapshot] = None
+    
+    def get_all(self) -> List[Category]:
+        """Get all categories."""
+        return list(self._get_snapshot().categories)
+    
+    def get_by_id(self, category_id: int) -> Optional[Category]:
+        """Get category by ID."""
+        return self._get_snapshot().categories_by_id.get(category_id)
+    
+    def get_subcategory_by_id(self, subcategory_id: int) -> Optional[Subcategory]:
+        """Get subcategory by ID."""
+        return self._get_snapshot().subcategories_by_id.get(subcategory_id)
+    
+    def get_subcategories_by_category(self, category_id: int) -> List[Subcategory]:
+        """Get subcategories for a category."""
+        return list(self._get_snapshot().subcategories_by_category.get(category_id, []))
+    
+    def get_all_subcategories(self) -> List[Subcategory]:
+        """Get all subcategories ordered by name."""
+        return list(self._get_snapshot().subcategories_by_id.values())
+    
+    def get_tree(self) -> List[Tuple[Category, List[Subcategory]]]:
+        """Get all categories with their subcategories ordered by name."""
+        return [
+            (category, list(subcategories))
+            for category, subcategories in self._get_snapshot().tree
+        ]
+    
+    def _get_snapshot(self) -> _CategorySnapshot:
+        """Return the current snapshot, reloading it if the version moved."""
+        version = self.version.get()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        
+        tree = self.inner.get_tree()
+        categories = [category for category, _ in tree]
+        subcategories_by_category: Dict[int, List[Subcategory]] = {
+            category.id: subcategories for category, subcategories in tree
+        }
+        subcategories = sorted(
+            (subcategory for _, category_subcategories in tree for subcategory in category_subcategories),
+            key=lambda subcategory: (subcategory.name, subcategory.id)
+        )
+        
+        snapshot = _CategorySnapshot(
+            version=version,
+            categories=categories,
+            tree=tree,
+            categories_by_id={category.id: category for category in categories},
+            subcategories_by_id={subcategory.id: subcategory for subcategory in subcategories},
+            subcategories_by_category=subcategories_by_category,
+        )
+        self._snapshot = snapshot
+        return snapshot
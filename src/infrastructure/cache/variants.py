@@ -0,0 +1,24 @@
+"""Shared cache of variant group member previews."""
+from typing import Iterable
+
+from django.db import transaction
+
+from src.infrastructure.cache.versions import shared_cache
+
+
+def variant_previews_key(variant_group_id: int) -> str:
+    """Cache key of the ordered preview list for a variant group."""
+    return f'variant_previews:{variant_group_id}'
+
+
+def invalidate_variant_previews(variant_group_ids: Iterable[int]) -> None:
+    """Drop cached previews for the given variant groups."""
+    keys = [variant_previews_key(group_id) for group_id in set(variant_group_ids) if group_id]
+    if not keys:
+        return
+    shared_cache.delete_many(keys)
+    
+    # A reader may cache the old rows again before the writer commits; drop
+    # them once more after commit (same reasoning as VersionStamp.bump)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: shared_cache.delete_many(keys))
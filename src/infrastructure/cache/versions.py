@@ -0,0 +1,116 @@
+"""Version stamps for invalidating in-process caches across workers."""
+import threading
+import time
+from typing import Dict, List, Sequence
+
+from django.core.cache import caches
+from django.core.signals import request_started, request_finished
+from django.db import transaction
+from django.utils.connection import ConnectionProxy
+
+
+# Write-invalidated data every worker must agree on (see CACHES['shared'])
+shared_cache = ConnectionProxy(caches, 'shared')
+
+_request_state = threading.local()
+
+
+def _begin_request(**kwargs) -> None:
+    """Start memoizing version reads for the current request."""
+    _request_state.versions = {}
+
+
+def _end_request(**kwargs) -> None:
+    """Stop memoizing version reads once the request is done."""
+    _request_state.versions = None
+
+
+request_started.connect(_begin_request, dispatch_uid='version_stamps_begin_request')
+request_finished.connect(_end_request, dispatch_uid='version_stamps_end_request')
+
+
+class VersionStamp:
+    """Monotonic version counter stored in the ``shared`` Django cache.
+    
+    Writers call ``bump()`` (usually from signal handlers); readers compare
+    ``get()`` with the version their in-memory data was built from. Within a
+    request the value is read from the shared cache at most once.
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.cache_key = f'version:{name}'
+    
+    def get(self) -> int:
+        """Get the current version."""
+        memo: Dict[str, int] = getattr(_request_state, 'versions', None)
+        if memo is not None and self.name in memo:
+            return memo[self.name]
+        
+        version = shared_cache.get(self.cache_key)
+        if version is None:
+            # Seed from the clock so an evicted stamp never reuses an old value
+            shared_cache.add(self.cache_key, time.time_ns(), timeout=None)
+            version = shared_cache.get(self.cache_key)
+        
+        if memo is not None:
+            memo[self.name] = version
+        return version
+    
+    def make_key(self, *parts) -> str:
+        """Build a cache key that changes whenever this stamp is bumped."""
+        return ':'.join([self.name, str(self.get()), *map(str, parts)])
+    
+    def bump(self) -> int:
+        """Invalidate everything built from the current version."""
+        version = self._advance()
+        
+        # Readers can rebuild data from the old rows under the new version
+        # until the writer's transaction commits; bump again once it does
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(self._advance)
+        return version
+    
+    def _advance(self) -> int:
+        """Store and return a version newer than both the current one and the clock."""
+        version = max(shared_cache.get(self.cache_key) or 0, time.time_ns()) + 1
+        shared_cache.set(self.cache_key, version, timeout=None)
+        
+        memo: Dict[str, int] = getattr(_request_state, 'versions', None)
+        if memo is not None:
+            memo[self.name] = version
+        return version
+
+
+def get_versions(stamps: Sequence[VersionStamp]) -> List[int]:
+    """Current versions of several stamps, reading the shared cache once."""
+    memo: Dict[str, int] = getattr(_request_state, 'versions', None)
+    versions = {
+        stamp.name: memo[stamp.name]
+        for stamp in stamps if memo is not None and stamp.name in memo
+    }
+    missing = [stamp for stamp in stamps if stamp.name not in versions]
+    if missing:
+        found = shared_cache.get_many([stamp.cache_key for stamp in missing])
+        for stamp in missing:
+            if stamp.cache_key not in found:
+                # Seeds the stamp (and memoizes it)
+                versions[stamp.name] = stamp.get()
+                continue
+            versions[stamp.name] = found[stamp.cache_key]
+            if memo is not None:
+                memo[stamp.name] = versions[stamp.name]
+    return [versions[stamp.name] for stamp in stamps]
+
+
+# Categories and subcategories
+CATEGORY_VERSION = VersionStamp('categories')
+
+# Attribute definitions and subcategory parents (spec filter resolution)
+ATTRIBUTE_VERSION = VersionStamp('attributes')
+
+# Any catalog data: products, their subcategories, variants and attributes
+CATALOG_VERSION = VersionStamp('catalog')
+
+# Homepage sections and their items
+HOMEPAGE_VERSION = VersionStamp('homepage')
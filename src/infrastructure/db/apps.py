@@ -9,3 +9,6 @@ class DbConfig(AppConfig):
     label = 'db'
     verbose_name = 'Database Models'
 
+    def ready(self):
+        """Register signal handlers."""
+        from src.infrastructure.db import signals  # noqa: F401
@@ -0,0 +1,149 @@
+"""Bounded per-process pool of DB-API connections."""
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, NamedTuple
+
+from django.db import OperationalError
+
+
+class _IdleConnection(NamedTuple):
+    """Connection waiting in the pool."""
+    connection: Any
+    created_at: float
+    released_at: float
+
+
+class ConnectionPool:
+    """Pool of open connections shared by the threads of one process.
+    
+    At most ``max_size`` connections are open at a time; ``acquire`` waits up
+    to ``timeout`` seconds for one to be returned. Connections older than
+    ``max_lifetime`` seconds are closed instead of reused, and connections
+    idle for longer than ``check_after`` seconds are health-checked before
+    being handed out again.
+    """
+    
+    def __init__(
+        self,
+        check: Callable[[Any], bool],
+        reset: Callable[[Any], bool],
+        max_size: int = 10,
+        max_lifetime: float = 1800,
+        check_after: float = 30,
+        timeout: float = 30
+    ):
+        self.check = check
+        self.reset = reset
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.check_after = check_after
+        self.timeout = timeout
+        self.pid = os.getpid()
+        self._idle: Deque[_IdleConnection] = deque()
+        self._created_at: Dict[int, float] = {}  # id() of checked-out connections
+        self._size = 0
+        self._condition = threading.Condition()
+    
+    def acquire(self, connect: Callable[[], Any]) -> Any:
+        """Borrow an open connection, calling ``connect`` if a new one is needed."""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self._condition:
+                if self._idle:
+                    # Most recently used first: warmest, least likely to be stale
+                    idle = self._idle.pop()
+                elif self._size < self.max_size:
+                    idle = None
+                    self._size += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise OperationalError(
+                            f"No database connection available within {self.timeout}s "
+                            f"(pool of {self.max_size})"
+                        )
+                    self._condition.wait(remaining)
+                    continue
+            
+            if idle is None:
+                try:
+                    connection = connect()
+                except BaseException:
+                    self._forget()
+                    raise
+                self._created_at[id(connection)] = time.monotonic()
+                return connection
+            
+            if self._reusable(idle):
+                self._created_at[id(idle.connection)] = idle.created_at
+                return idle.connection
+            self._discard(idle.connection)
+    
+    def release(self, connection: Any, reusable: bool = True) -> None:
+        """Return a borrowed connection, closing it if it can't be reused."""
+        created_at = self._created_at.pop(id(connection), None)
+        if created_at is None:
+            # Not borrowed from this pool (e.g. opened before a fork)
+            self._close(connection)
+            return
+        if (
+            not reusable
+            or time.monotonic() - created_at >= self.max_lifetime
+            or not self.reset(connection)
+        ):
+            self._discard(connection)
+            return
+        
+        with self._condition:
+            self._idle.append(_IdleConnection(connection, created_at, time.monotonic()))
+            self._condition.notify()
+    
+    def _reusable(self, idle: _IdleConnection) -> bool:
+        """Whether an idle connection is young enough and still answers."""
+        now = time.monotonic()
+        if now - idle.created_at >= self.max_lifetime:
+            return False
+        if now - idle.released_at >= self.check_after:
+            return self.check(idle.connection)
+        return True
+    
+    def _discard(self, connection: Any) -> None:
+        """Close a connection and free its slot."""
+        self._close(connection)
+        self._forget()
+    
+    @staticmethod
+    def _close(connection: Any) -> None:
+        """Close a connection, ignoring errors from already broken ones."""
+        try:
+            connection.close()
+        except Exception:
+            pass
+    
+    def _forget(self) -> None:
+        """Free one slot and wake up a waiting thread."""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias: str, factory: Callable[[], ConnectionPool]) -> ConnectionPool:
+    """Return the process-wide pool for a database alias, creating it once.
+    
+    A pool inherited through ``fork()`` is replaced, never reused: its
+    sockets belong to the parent process.
+    """
+    pool = _pools.get(alias)
+    if pool is not None and pool.pid == os.getpid():
+        return pool
+    with _pools_lock:
+        pool = _pools.get(alias)
+        if pool is None or pool.pid != os.getpid():
+            pool = _pools[alias] = factory()
+        return pool
@@ -0,0 +1,83 @@
+"""PostgreSQL backend that borrows connections from a per-process pool.
+
+Enable with ``DB_POOL_ENABLED=True`` (see config/settings.py). ``connect()``
+borrows an open connection and ``close()`` hands it back, so a request only
+pays the TCP/TLS and authentication handshake when the pool has to grow.
+Returned connections are rolled back to an idle state and nothing else is
+kept per session, which keeps them safe behind transaction-mode poolers
+(psycopg2 never prepares statements server-side, and Django disables
+psycopg 3 prepared statements unless OPTIONS asks for them).
+"""
+from django.db.backends.postgresql import base as postgresql
+
+from src.infrastructure.db.backends.pool import ConnectionPool, get_pool
+
+
+# libpq PQTRANS_IDLE: connected, no transaction open
+_TRANSACTION_IDLE = 0
+
+
+def _check(connection) -> bool:
+    """Ping an idle connection."""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        if connection.info.transaction_status != _TRANSACTION_IDLE:
+            connection.rollback()
+    except postgresql.Database.Error:
+        return False
+    return True
+
+
+def _reset(connection) -> bool:
+    """Leave no transaction open on a returned connection; False if it is broken."""
+    if connection.closed:
+        return False
+    try:
+        if connection.info.transaction_status != _TRANSACTION_IDLE:
+            connection.rollback()
+    except postgresql.Database.Error:
+        return False
+    return connection.info.transaction_status == _TRANSACTION_IDLE
+
+
+class DatabaseWrapper(postgresql.DatabaseWrapper):
+    """PostgreSQL database wrapper with pooled connections.
+    
+    Pool limits come from the ``POOL`` entry of the database settings:
+    ``MAX_SIZE``, ``MAX_LIFETIME``, ``CHECK_AFTER`` and ``TIMEOUT`` (seconds).
+    """
+    
+    @property
+    def pool(self) -> ConnectionPool:
+        """Pool shared by all threads of this process for this alias."""
+        options = self.settings_dict.get('POOL', {})
+        return get_pool(self.alias, lambda: ConnectionPool(
+            check=_check,
+            reset=_reset,
+            max_size=options.get('MAX_SIZE', 10),
+            max_lifetime=options.get('MAX_LIFETIME', 1800),
+            check_after=options.get('CHECK_AFTER', 30),
+            timeout=options.get('TIMEOUT', 30),
+        ))
+    
+    def get_new_connection(self, conn_params):
+        """Borrow a connection, opening a new one only when the pool is empty."""
+        connection = self.pool.acquire(
+            lambda: super(DatabaseWrapper, self).get_new_connection(conn_params)
+        )
+        # Set by the parent while connecting; reused connections need it too
+        self.isolation_level = postgresql.IsolationLevel(
+            self.settings_dict['OPTIONS'].get(
+                'isolation_level', postgresql.IsolationLevel.READ_COMMITTED
+            )
+        )
+        return connection
+    
+    def _close(self):
+        """Return the connection to the pool instead of closing it."""
+        if self.connection is not None:
+            # A connection that saw errors is only kept if it still answers
+            reusable = not self.errors_occurred or self.is_usable()
+            with self.wrap_database_errors:
+                self.pool.release(self.connection, reusable=reusable)
@@ -0,0 +1,125 @@
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from src.application.catalog.dto import ListProductsRequest
+from src.application.catalog.use_cases import (
+    ListProductsUseCase,
+    ListProductCardsUseCase,
+    GetProductUseCase,
+)
+from src.application.homepage.use_cases import GetHomePageSectionsUseCase
+from src.infrastructure.db.models.catalog import Product
+from src.infrastructure.db.repositories.catalog_repo import (
+    DjangoCategoryRepository,
+    DjangoProductRepository,
+)
+from src.infrastructure.db.repositories.homepage_repo import (
+    DjangoHomeSectionRepository,
+    DjangoProductCardRepository,
+)
+from interfaces.rest.catalog.serializers import (
+    ProductResponseSerializer,
+    PaginatedProductResponseSerializer,
+    PaginatedProductCardResponseSerializer,
+    encode_product_response,
+    encode_paginated_products,
+    encode_paginated_product_cards,
+)
+from interfaces.rest.homepage.serializers import (
+    HomePageResponseSerializer,
+    encode_home_page,
+)
+
+
+class Command(BaseCommand):
+    help = "Compare DRF serializers with the precompiled response encoders"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=100,
+            help="Products per list page",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="Encodings per measurement",
+        )
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+        iterations = options["iterations"]
+        category_repo = DjangoCategoryRepository()
+        product_repo = DjangoProductRepository()
+
+        cases = []
+
+        page = ListProductsUseCase(product_repo, category_repo).execute(
+            ListProductsRequest(page_size=page_size)
+        )
+        envelope = {
+            "items": page.items,
+            "total": page.total,
+            "page": page.page,
+            "page_size": page.page_size,
+            "total_pages": page.total_pages,
+            "has_next": page.has_next,
+            "has_previous": page.has_previous,
+        }
+        cases.append((
+            f"product list ({len(page.items)} items)",
+            lambda: PaginatedProductResponseSerializer(envelope).data,
+            lambda: encode_paginated_products(envelope),
+        ))
+
+        cards = ListProductCardsUseCase(product_repo).execute(
+            ListProductsRequest(page_size=page_size)
+        )
+        card_envelope = {**envelope, "items": cards.items}
+        cases.append((
+            f"product cards ({len(cards.items)} items)",
+            lambda: PaginatedProductCardResponseSerializer(card_envelope).data,
+            lambda: encode_paginated_product_cards(card_envelope),
+        ))
+
+        product_id = Product.objects.order_by("id").values_list("id", flat=True).first()
+        if product_id is not None:
+            product = GetProductUseCase(product_repo).execute(product_id)
+            cases.append((
+                "product detail",
+                lambda: ProductResponseSerializer(product).data,
+                lambda: encode_product_response(product),
+            ))
+
+        try:
+            homepage = GetHomePageSectionsUseCase(
+                DjangoHomeSectionRepository(),
+                DjangoProductCardRepository(),
+            ).execute()
+        except Exception as e:
+            self.stderr.write(self.style.WARNING(f"Skipping homepage: {e}"))
+        else:
+            cases.append((
+                f"homepage ({len(homepage.sections)} sections)",
+                lambda: HomePageResponseSerializer(homepage).data,
+                lambda: encode_home_page(homepage),
+            ))
+
+        renderer = JSONRenderer()
+        for label, drf, fast in cases:
+            if renderer.render(drf()) != renderer.render(fast()):
+                raise CommandError(f"Encoder output differs from DRF for {label}")
+
+            drf_seconds = timeit.timeit(drf, number=iterations)
+            fast_seconds = timeit.timeit(fast, number=iterations)
+            self.stdout.write(
+                f"{label}: DRF {drf_seconds / iterations * 1000:.3f} ms, "
+                f"encoder {fast_seconds / iterations * 1000:.3f} ms "
+                f"({drf_seconds / fast_seconds:.1f}x)"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Encoder output matches DRF for all cases."))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from src.application.catalog.use_cases import RefreshProductListingsUseCase
+from src.infrastructure.cache.catalog_repo import CachedCategoryRepository
+from src.infrastructure.db.models.catalog import Product
+from src.infrastructure.db.repositories.catalog_repo import (
+    DjangoCategoryRepository,
+    DjangoProductRepository,
+    DjangoProductListingRepository,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized product listing read model"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of products assembled per batch",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        product_repo = DjangoProductRepository()
+        use_case = RefreshProductListingsUseCase(
+            product_repo,
+            CachedCategoryRepository(DjangoCategoryRepository()),
+            DjangoProductListingRepository(product_repo.list_query),
+        )
+
+        product_ids = list(Product.objects.order_by("id").values_list("id", flat=True))
+        written = 0
+        for start in range(0, len(product_ids), batch_size):
+            written += use_case.execute(product_ids[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {written} product listings."
+        ))
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0004_subcategory_description_m2m'),
+    ]
+
+    operations = [
+        # The index itself was already dropped with raw SQL in 0004
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name='product',
+                    name='products_subcate_db3262_idx',
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['-created_at', 'id'], name='products_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:10
+
+from django.conf import settings
+from django.db import migrations
+
+
+POSTGRES_CREATE = [
+    """
+    CREATE TABLE product_search (
+        product_id bigint PRIMARY KEY REFERENCES products (id) ON DELETE CASCADE,
+        document tsvector NOT NULL
+    )
+    """,
+    "CREATE INDEX product_search_document_gin ON product_search USING gin (document)",
+]
+
+# Same document as PostgresSearchBackend, with the PRODUCT_SEARCH_CONFIG
+# text search configuration queries are parsed with
+POSTGRES_INDEX = """
+    INSERT INTO product_search (product_id, document)
+    SELECT p.id,
+        setweight(to_tsvector(%s::regconfig, coalesce(p.name, '')), 'A')
+        || setweight(to_tsvector(%s::regconfig, coalesce(p.brand, '')), 'B')
+        || setweight(to_tsvector(%s::regconfig, coalesce(p.variant_color_name, '')), 'B')
+        || setweight(to_tsvector(%s::regconfig, coalesce((
+            SELECT string_agg(v.value_text, ' ')
+            FROM product_attribute_values v
+            JOIN attributes a ON a.id = v.attribute_id
+            WHERE v.product_id = p.id AND a.data_type = 'TEXT'
+        ), '')), 'C')
+    FROM products p
+    """
+
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE product_search USING fts5(
+        name, brand, color, attributes, tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    INSERT INTO product_search (rowid, name, brand, color, attributes)
+    SELECT p.id,
+        p.name,
+        coalesce(p.brand, ''),
+        coalesce(p.variant_color_name, ''),
+        coalesce((
+            SELECT group_concat(v.value_text, ' ')
+            FROM product_attribute_values v
+            JOIN attributes a ON a.id = v.attribute_id
+            WHERE v.product_id = p.id AND a.data_type = 'TEXT'
+        ), '')
+    FROM products p
+    """,
+]
+
+
+def create_search_table(apps, schema_editor):
+    statements = {
+        'postgresql': POSTGRES_CREATE,
+        'sqlite': SQLITE_CREATE,
+    }.get(schema_editor.connection.vendor, [])
+    for statement in statements:
+        schema_editor.execute(statement)
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(POSTGRES_INDEX, [settings.PRODUCT_SEARCH_CONFIG] * 4)
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor in ('postgresql', 'sqlite'):
+        schema_editor.execute("DROP TABLE IF EXISTS product_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0005_product_keyset_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+    ]
@@ -1,7 +1,8 @@
 from .users import User, Address
 from .catalog import (
     Category, Subcategory, VariantGroup, Product, ProductVariant, VariantSize,
-    Attribute, AttributeOption, ProductAttributeValue, ProductAttributeOption
+    Attribute, AttributeOption, ProductAttributeValue, ProductAttributeOption,
+    ProductListing
 )
 from .homepage import HomeSection, HomeSectionItem
 
@@ -9,6 +10,7 @@ __all__ = [
     'User', 'Address',
     'Category', 'Subcategory', 'VariantGroup', 'Product', 'ProductVariant', 'VariantSize',
     'Attribute', 'AttributeOption', 'ProductAttributeValue', 'ProductAttributeOption',
+    'ProductListing',
     'HomeSection', 'HomeSectionItem'
 ]
 
@@ -105,6 +105,8 @@ class Product(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['category', 'availability']),
+            # Keyset pagination order
+            models.Index(fields=['-created_at', 'id'], name='products_created_id_idx'),
         ]
     
     def __str__(self):
@@ -238,3 +240,22 @@ class ProductAttributeOption(models.Model):
     def __str__(self):
         return f"{self.product_attribute_value} - {self.option.label}"
 
+
+class ProductListing(models.Model):
+    """Denormalized product list payload (read model, maintained from signals)."""
+    product = models.OneToOneField(
+        Product,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='listing'
+    )
+    payload = models.JSONField()
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'product_listings'
+        verbose_name = 'Product Listing'
+        verbose_name_plural = 'Product Listings'
+    
+    def __str__(self):
+        return f"Listing for product #{self.product_id}"
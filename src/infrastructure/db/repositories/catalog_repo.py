@@ -1,8 +1,14 @@
 """Catalog repository implementation."""
-from typing import Optional, List, Dict, Tuple
-from django.db.models import Q, Prefetch
-from django.core.paginator import Paginator
+import base64
+import json
+from dataclasses import asdict
+from datetime import datetime
 from decimal import Decimal
+from typing import Optional, List, Dict, Tuple
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q, F, Prefetch, Count, Min, Max, Case, When, Value, IntegerField
 
 from src.domain.catalog.entities import (
     Category, Subcategory, Product, VariantGroup, Attribute,
@@ -10,8 +16,30 @@ from src.domain.catalog.entities import (
 )
 from typing import Optional
 from src.domain.shared.types import Currency, Availability, AttributeDataType, ScopeType
-from src.application.catalog.ports import CategoryRepository, ProductRepository
-from src.application.catalog.dto import SpecificationDetail
+from src.domain.shared.exceptions import ValidationError
+from src.application.catalog.ports import (
+    CategoryRepository, ProductRepository, ProductListingRepository
+)
+from src.application.catalog.dto import (
+    CategoryResponse,
+    SubcategoryResponse,
+    ProductResponse,
+    ProductCardResponse,
+    ProductAggregate,
+    VariantProductPreview,
+    SpecificationDetail,
+    ProductFacetsResponse,
+    CategoryProductCounts,
+    SubcategoryFacet,
+    AttributeFacet,
+    FacetValue,
+)
+from src.infrastructure.cache.versions import CATALOG_VERSION, shared_cache
+from src.infrastructure.cache.variants import variant_previews_key
+from src.infrastructure.metrics.collector import CACHE_REQUESTS
+from src.infrastructure.db.repositories.spec_filters import SpecFilterCompiler
+from src.infrastructure.db.repositories.product_query import ProductListQuery
+from src.infrastructure.search.backends import ProductSearchBackend
 
 from src.infrastructure.db.models.catalog import (
     Category as CategoryModel,
@@ -23,23 +51,46 @@ from src.infrastructure.db.models.catalog import (
     Attribute as AttributeModel,
     AttributeOption as AttributeOptionModel,
     ProductAttributeValue as ProductAttributeValueModel,
-    ProductAttributeOption as ProductAttributeOptionModel
+    ProductAttributeOption as ProductAttributeOptionModel,
+    ProductListing as ProductListingModel
 )
 
 
+def category_to_domain(category_model: CategoryModel) -> Category:
+    """Convert a Django category model to the domain entity."""
+    return Category(
+        id=category_model.id,
+        name=category_model.name,
+        slug=category_model.slug,
+        created_at=category_model.created_at
+    )
+
+
+def subcategory_to_domain(subcategory_model: SubcategoryModel) -> Subcategory:
+    """Convert a Django subcategory model to the domain entity."""
+    return Subcategory(
+        id=subcategory_model.id,
+        category_id=subcategory_model.category_id,
+        name=subcategory_model.name,
+        slug=subcategory_model.slug,
+        description=subcategory_model.description,
+        created_at=subcategory_model.created_at
+    )
+
+
 class DjangoCategoryRepository(CategoryRepository):
     """Django category repository implementation."""
     
     def get_all(self) -> List[Category]:
         """Get all categories."""
         category_models = CategoryModel.objects.all()
-        return [self._to_domain(cat) for cat in category_models]
+        return [category_to_domain(cat) for cat in category_models]
     
     def get_by_id(self, category_id: int) -> Optional[Category]:
         """Get category by ID."""
         try:
             category_model = CategoryModel.objects.get(id=category_id)
-            return self._to_domain(category_model)
+            return category_to_domain(category_model)
         except CategoryModel.DoesNotExist:
             return None
     
@@ -47,41 +98,50 @@ class DjangoCategoryRepository(CategoryRepository):
         """Get subcategory by ID."""
         try:
             subcategory_model = SubcategoryModel.objects.select_related('category').get(id=subcategory_id)
-            return self._to_domain_subcategory(subcategory_model)
+            return subcategory_to_domain(subcategory_model)
         except SubcategoryModel.DoesNotExist:
             return None
-
+    
     def get_subcategories_by_category(self, category_id: int) -> List[Subcategory]:
         """Get subcategories for a category."""
         subcategory_models = SubcategoryModel.objects.filter(
             category_id=category_id
         ).order_by('name')
-        return [self._to_domain_subcategory(sub) for sub in subcategory_models]
+        return [subcategory_to_domain(sub) for sub in subcategory_models]
     
-    def _to_domain_subcategory(self, subcategory_model: SubcategoryModel) -> Subcategory:
-        """Convert Django model to domain entity."""
-        return Subcategory(
-            id=subcategory_model.id,
-            category_id=subcategory_model.category_id,
-            name=subcategory_model.name,
-            slug=subcategory_model.slug,
-            description=subcategory_model.description,
-            created_at=subcategory_model.created_at
-        )
+    def get_all_subcategories(self) -> List[Subcategory]:
+        """Get all subcategories ordered by name."""
+        subcategory_models = SubcategoryModel.objects.order_by('name', 'id')
+        return [subcategory_to_domain(sub) for sub in subcategory_models]
     
-    def _to_domain(self, category_model: CategoryModel) -> Category:
-        """Convert Django model to domain entity."""
-        return Category(
-            id=category_model.id,
-            name=category_model.name,
-            slug=category_model.slug,
-            created_at=category_model.created_at
+    def get_tree(self) -> List[Tuple[Category, List[Subcategory]]]:
+        """Get all categories with their subcategories (one query per table)."""
+        category_models = CategoryModel.objects.prefetch_related(
+            Prefetch(
+                'subcategories',
+                queryset=SubcategoryModel.objects.order_by('name', 'id'),
+                to_attr='ordered_subcategories'
+            )
         )
+        return [
+            (
+                category_to_domain(category_model),
+                [subcategory_to_domain(sub) for sub in category_model.ordered_subcategories]
+            )
+            for category_model in category_models
+        ]
 
 
 class DjangoProductRepository(ProductRepository):
     """Django product repository implementation."""
     
+    def __init__(
+        self,
+        spec_filter_compiler: Optional[SpecFilterCompiler] = None,
+        search_backend: Optional[ProductSearchBackend] = None
+    ):
+        self.list_query = ProductListQuery(spec_filter_compiler, search_backend)
+    
     def get_all(
         self,
         category_id: Optional[int] = None,
@@ -90,72 +150,348 @@ class DjangoProductRepository(ProductRepository):
         availability: Optional[str] = None,
         spec_filters: Optional[Dict[str, str]] = None,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        estimate_total: bool = False
     ) -> Tuple[List[Product], int]:
         """Get all products with filters and pagination."""
-        queryset = ProductModel.objects.select_related('category').prefetch_related(
-            'subcategories'
+        filters = dict(
+            category_id=category_id,
+            subcategory_ids=subcategory_ids,
+            search=search,
+            availability=availability,
+            spec_filters=spec_filters
+        )
+        page_queryset, total = self.list_query.page(
+            self.list_query.filtered_queryset(**filters), filters, page, page_size, estimate_total
+        )
+        products = [self._to_domain(p) for p in page_queryset]
+        return products, total
+    
+    def get_page_after(
+        self,
+        cursor: Optional[str] = None,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+        estimate_total: bool = False
+    ) -> Tuple[List[Product], Optional[str], Optional[int]]:
+        """Get the products following a cursor, ordered by (-created_at, id)."""
+        filters = dict(
+            category_id=category_id,
+            subcategory_ids=subcategory_ids,
+            search=search,
+            availability=availability,
+            spec_filters=spec_filters
+        )
+        queryset = self.list_query.filtered_queryset(**filters)
+        
+        total = self.list_query.count(queryset, filters, estimate_total) if include_total else None
+        
+        product_models, next_cursor = self._keyset_page(queryset, cursor, page_size)
+        products = [self._to_domain(p) for p in product_models]
+        return products, next_cursor, total
+    
+    def get_cards(
+        self,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        estimate_total: bool = False
+    ) -> Tuple[List[ProductCardResponse], int]:
+        """Get a page of product cards, loading only the card columns."""
+        filters = dict(
+            category_id=category_id,
+            subcategory_ids=subcategory_ids,
+            search=search,
+            availability=availability,
+            spec_filters=spec_filters
+        )
+        page_queryset, total = self.list_query.page(
+            self._card_queryset(self.list_query.filtered_queryset(**filters)),
+            filters, page, page_size, estimate_total
+        )
+        return [self._to_card(p) for p in page_queryset], total
+    
+    def get_cards_after(
+        self,
+        cursor: Optional[str] = None,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+        estimate_total: bool = False
+    ) -> Tuple[List[ProductCardResponse], Optional[str], Optional[int]]:
+        """Get the product cards following a cursor, loading only the card columns."""
+        filters = dict(
+            category_id=category_id,
+            subcategory_ids=subcategory_ids,
+            search=search,
+            availability=availability,
+            spec_filters=spec_filters
         )
+        queryset = self.list_query.filtered_queryset(**filters)
+        
+        total = self.list_query.count(queryset, filters, estimate_total) if include_total else None
         
-        # Apply filters
-        if category_id:
-            queryset = queryset.filter(category_id=category_id)
-        if subcategory_ids:
-            queryset = queryset.filter(subcategories__id__in=subcategory_ids)
-        if search:
+        product_models, next_cursor = self._keyset_page(
+            self._card_queryset(queryset), cursor, page_size
+        )
+        return [self._to_card(p) for p in product_models], next_cursor, total
+    
+    def _keyset_page(self, queryset, cursor: Optional[str], page_size: int):
+        """Return the rows following a cursor in (-created_at, id) order and the next cursor."""
+        if cursor:
+            created_at, product_id = self._decode_cursor(cursor)
             queryset = queryset.filter(
-                Q(name__icontains=search) | Q(brand__icontains=search)
+                Q(created_at__lt=created_at)
+                | Q(created_at=created_at, id__gt=product_id)
             )
-        if availability:
-            queryset = queryset.filter(availability=availability)
-        
-        # Apply spec filters
-        if spec_filters:
-            for key, value in spec_filters.items():
-                # Find attribute by key
-                try:
-                    attr = AttributeModel.objects.get(key=key)
-                    # Filter products by attribute value
-                    if attr.data_type == AttributeModel.DataTypeChoices.TEXT:
-                        queryset = queryset.filter(
-                            attribute_values__attribute=attr,
-                            attribute_values__value_text__icontains=value
-                        )
-                    elif attr.data_type == AttributeModel.DataTypeChoices.NUMBER:
-                        try:
-                            num_value = Decimal(value)
-                            queryset = queryset.filter(
-                                attribute_values__attribute=attr,
-                                attribute_values__value_number=num_value
-                            )
-                        except (ValueError, TypeError):
-                            pass
-                    elif attr.data_type == AttributeModel.DataTypeChoices.BOOLEAN:
-                        bool_value = value.lower() in ('true', '1', 'yes')
-                        queryset = queryset.filter(
-                            attribute_values__attribute=attr,
-                            attribute_values__value_bool=bool_value
-                        )
-                    elif attr.data_type in [
-                        AttributeModel.DataTypeChoices.SINGLE_SELECT,
-                        AttributeModel.DataTypeChoices.MULTI_SELECT
-                    ]:
-                        queryset = queryset.filter(
-                            attribute_values__attribute=attr,
-                            attribute_values__selected_options__option__value=value
-                        )
-                except AttributeModel.DoesNotExist:
-                    pass
-        
-        # Get total count before pagination
-        total = queryset.distinct().count()
-        
-        # Paginate
-        paginator = Paginator(queryset.distinct(), page_size)
-        page_obj = paginator.get_page(page)
-        
-        products = [self._to_domain(p) for p in page_obj]
-        return products, total
+        
+        # Fetch one extra row to know whether another page exists
+        product_models = list(
+            queryset.order_by('-created_at', 'id')[:page_size + 1]
+        )
+        next_cursor = None
+        if len(product_models) > page_size:
+            product_models = product_models[:page_size]
+            next_cursor = self._encode_cursor(product_models[-1])
+        return product_models, next_cursor
+    
+    # Columns behind a product card (plus created_at for keyset cursors)
+    _CARD_FIELDS = (
+        'id', 'name', 'brand', 'price', 'price_new', 'price_old', 'currency',
+        'availability', 'variant_image', 'variant_color_name',
+        'variant_color_palette', 'created_at',
+    )
+    
+    def _card_queryset(self, queryset):
+        """Narrow a filtered product queryset to the card columns."""
+        return queryset.select_related(None).prefetch_related(None).only(*self._CARD_FIELDS)
+    
+    def _to_card(self, product_model: ProductModel) -> ProductCardResponse:
+        """Convert a card-projected product model to a ProductCardResponse."""
+        return ProductCardResponse(
+            id=product_model.id,
+            name=product_model.name,
+            brand=product_model.brand,
+            price=str(product_model.price),
+            price_new=str(product_model.price_new) if product_model.price_new else None,
+            price_old=str(product_model.price_old) if product_model.price_old else None,
+            currency=product_model.currency,
+            availability=product_model.availability,
+            image=product_model.variant_image,
+            color_name=product_model.variant_color_name,
+            color_palette=product_model.variant_color_palette
+        )
+    
+    def get_facets(
+        self,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None
+    ) -> ProductFacetsResponse:
+        """Get facets with one grouped aggregate per facet kind, cached per filter set."""
+        filters = dict(
+            category_id=category_id,
+            subcategory_ids=subcategory_ids,
+            search=search,
+            availability=availability,
+            spec_filters=spec_filters
+        )
+        cache_key = CATALOG_VERSION.make_key(
+            'product_facets', self.list_query.filter_signature(filters)
+        )
+        facets = cache.get(cache_key)
+        CACHE_REQUESTS.inc(cache='product_facets', result='miss' if facets is None else 'hit')
+        if facets is not None:
+            return facets
+        
+        queryset = self.list_query.filtered_queryset(**filters)
+        product_ids = queryset.values('id')
+        
+        subcategory_rows = ProductModel.subcategories.through.objects.filter(
+            product_id__in=product_ids
+        ).values(
+            'subcategory_id', 'subcategory__name'
+        ).annotate(
+            count=Count('product_id', distinct=True)
+        ).order_by('subcategory__name', 'subcategory_id')
+        
+        availability_labels = dict(ProductModel.AvailabilityChoices.choices)
+        availability_rows = ProductModel.objects.filter(
+            id__in=product_ids
+        ).values('availability').annotate(count=Count('id')).order_by('availability')
+        
+        facets = ProductFacetsResponse(
+            total=self.list_query.count(queryset, filters, estimate=False),
+            subcategories=[
+                SubcategoryFacet(
+                    id=row['subcategory_id'],
+                    name=row['subcategory__name'],
+                    count=row['count']
+                )
+                for row in subcategory_rows
+            ],
+            availability=[
+                FacetValue(
+                    value=row['availability'],
+                    label=availability_labels.get(row['availability'], row['availability']),
+                    count=row['count']
+                )
+                for row in availability_rows
+            ],
+            attributes=self._attribute_facets(product_ids)
+        )
+        
+        cache.set(cache_key, facets, getattr(settings, 'PRODUCT_COUNT_CACHE_TIMEOUT', 600))
+        return facets
+    
+    def get_category_counts(self) -> CategoryProductCounts:
+        """Get counts with one grouped aggregate, cached until the catalog changes.
+        
+        Category rows come from ``products`` and subcategory rows from the
+        product-subcategory table, combined with UNION ALL.
+        """
+        cache_key = CATALOG_VERSION.make_key('category_counts')
+        counts = cache.get(cache_key)
+        CACHE_REQUESTS.inc(cache='category_counts', result='miss' if counts is None else 'hit')
+        if counts is not None:
+            return counts
+        
+        category_rows = ProductModel.objects.filter(
+            category_id__isnull=False
+        ).order_by().values_list('category_id', 'availability').annotate(
+            is_subcategory=Value(0, output_field=IntegerField()),
+            count=Count('id')
+        )
+        subcategory_rows = ProductModel.subcategories.through.objects.order_by().values_list(
+            'subcategory_id', 'product__availability'
+        ).annotate(
+            is_subcategory=Value(1, output_field=IntegerField()),
+            count=Count('product_id')
+        )
+        
+        counts = CategoryProductCounts(categories={}, subcategories={})
+        for node_id, availability, is_subcategory, count in category_rows.union(
+            subcategory_rows, all=True
+        ):
+            nodes = counts.subcategories if is_subcategory else counts.categories
+            nodes.setdefault(node_id, {})[availability] = count
+        
+        cache.set(cache_key, counts, getattr(settings, 'PRODUCT_COUNT_CACHE_TIMEOUT', 600))
+        return counts
+    
+    def _attribute_facets(self, product_ids) -> List[AttributeFacet]:
+        """Build facets for filterable attributes present on the given products.
+        
+        Attributes sharing a key and type across scopes are merged into one facet.
+        """
+        filterable = self.list_query.spec_filter_compiler.index.filterable()
+        if not filterable:
+            return []
+        
+        facets: Dict[Tuple[str, str], AttributeFacet] = {}
+        for attribute in filterable:
+            facets.setdefault((attribute.key, attribute.data_type), AttributeFacet(
+                key=attribute.key,
+                label=attribute.label,
+                type=attribute.data_type,
+                unit=attribute.unit,
+                values=[],
+                min=None,
+                max=None
+            ))
+        
+        DataType = AttributeModel.DataTypeChoices
+        attribute_values = ProductAttributeValueModel.objects.filter(
+            product_id__in=product_ids,
+            attribute_id__in=[attribute.id for attribute in filterable]
+        )
+        
+        # TEXT and BOOLEAN value counts
+        value_rows = attribute_values.filter(
+            attribute__data_type__in=[DataType.TEXT, DataType.BOOLEAN]
+        ).values(
+            'attribute__key', 'attribute__data_type', 'value_text', 'value_bool'
+        ).annotate(
+            count=Count('product_id', distinct=True)
+        ).order_by('-count', 'value_text', 'value_bool')
+        for row in value_rows:
+            facet = facets[(row['attribute__key'], row['attribute__data_type'])]
+            if row['attribute__data_type'] == DataType.BOOLEAN:
+                if row['value_bool'] is None:
+                    continue
+                value = 'true' if row['value_bool'] else 'false'
+            else:
+                if not row['value_text']:
+                    continue
+                value = row['value_text']
+            facet.values.append(FacetValue(value=value, label=value, count=row['count']))
+        
+        # NUMBER ranges
+        range_rows = attribute_values.filter(
+            attribute__data_type=DataType.NUMBER,
+            value_number__isnull=False
+        ).values(
+            'attribute__key', 'attribute__data_type'
+        ).annotate(
+            min_value=Min('value_number'),
+            max_value=Max('value_number')
+        ).order_by()
+        for row in range_rows:
+            facet = facets[(row['attribute__key'], row['attribute__data_type'])]
+            # Keep the column's two decimal places whatever the backend returns
+            facet.min = str(Decimal(row['min_value']).quantize(Decimal('0.01')))
+            facet.max = str(Decimal(row['max_value']).quantize(Decimal('0.01')))
+        
+        # SELECT option counts
+        option_rows = ProductAttributeOptionModel.objects.filter(
+            product_attribute_value__in=attribute_values.filter(
+                attribute__data_type__in=[DataType.SINGLE_SELECT, DataType.MULTI_SELECT]
+            )
+        ).values(
+            'option__attribute__key', 'option__attribute__data_type', 'option__value'
+        ).annotate(
+            label=Min('option__label'),
+            sort_order=Min('option__sort_order'),
+            count=Count('product_attribute_value__product_id', distinct=True)
+        ).order_by('sort_order', 'option__value')
+        for row in option_rows:
+            facet = facets[(row['option__attribute__key'], row['option__attribute__data_type'])]
+            facet.values.append(FacetValue(
+                value=row['option__value'],
+                label=row['label'],
+                count=row['count']
+            ))
+        
+        return [facet for facet in facets.values() if facet.values or facet.min is not None]
+    
+    def _encode_cursor(self, product_model: ProductModel) -> str:
+        """Encode the keyset position of a product as an opaque cursor."""
+        raw = json.dumps([product_model.created_at.isoformat(), product_model.id])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+    
+    def _decode_cursor(self, cursor: str) -> Tuple[datetime, int]:
+        """Decode a cursor produced by _encode_cursor."""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            created_at, product_id = json.loads(base64.urlsafe_b64decode(padded))
+            return datetime.fromisoformat(created_at), int(product_id)
+        except (ValueError, TypeError):
+            raise ValidationError("Invalid cursor")
     
     def get_by_id(self, product_id: int) -> Optional[Product]:
         """Get product by ID."""
@@ -167,6 +503,15 @@ class DjangoProductRepository(ProductRepository):
         except ProductModel.DoesNotExist:
             return None
     
+    def get_by_ids(self, product_ids: List[int]) -> List[Product]:
+        """Get products by IDs, in ascending id order."""
+        product_models = ProductModel.objects.filter(
+            id__in=product_ids
+        ).select_related('category', 'variant_group').prefetch_related(
+            'subcategories'
+        ).order_by('id')
+        return [self._to_domain(p) for p in product_models]
+    
     def get_variant_group_products(
         self,
         variant_group_id: int,
@@ -183,93 +528,226 @@ class DjangoProductRepository(ProductRepository):
             queryset = queryset.exclude(id=exclude_product_id)
         
         # Order: default product first (if exists), then by id
-        variant_group = VariantGroupModel.objects.filter(id=variant_group_id).first()
-        if variant_group and variant_group.default_product_id:
-            # Put default first
-            from django.db.models import Case, When, IntegerField
-            queryset = queryset.annotate(
-                is_default=Case(
-                    When(id=variant_group.default_product_id, then=0),
-                    default=1,
-                    output_field=IntegerField()
-                )
-            ).order_by('is_default', 'id')
-        else:
-            queryset = queryset.order_by('id')
+        queryset = queryset.annotate(
+            is_default=self._is_default_variant()
+        ).order_by('is_default', 'id')
         
         return [self._to_domain(p) for p in queryset]
     
+    def get_aggregates(self, product_ids: List[int]) -> Dict[int, ProductAggregate]:
+        """Load product aggregates in five queries.
+        
+        One each for products with categories, subcategories and variant group
+        members, and two for specifications.
+        """
+        if not product_ids:
+            return {}
+        
+        product_models = list(self._aggregate_queryset(product_ids))
+        return self._build_aggregates(
+            product_models,
+            self._variant_previews(
+                {p.variant_group_id for p in product_models if p.variant_group_id}
+            ),
+            self.get_specifications_bulk([p.id for p in product_models])
+        )
+    
+    async def aget_aggregates(self, product_ids: List[int]) -> Dict[int, ProductAggregate]:
+        """Async version of ``get_aggregates``.
+        
+        The ORM runs sync code on the one thread-sensitive executor, so the
+        queries run one after another either way; a single hop avoids paying
+        the thread switch for each of them.
+        """
+        return await sync_to_async(self.get_aggregates)(product_ids)
+    
+    def _aggregate_queryset(self, product_ids: List[int]):
+        """Products with their category (joined) and subcategories (prefetched)."""
+        return ProductModel.objects.filter(id__in=product_ids).select_related(
+            'category'
+        ).prefetch_related('subcategories')
+    
+    def _build_aggregates(
+        self,
+        product_models: List[ProductModel],
+        variant_previews: Dict[int, List[VariantProductPreview]],
+        specifications: Dict[int, Tuple[Dict[str, str], List[SpecificationDetail]]]
+    ) -> Dict[int, ProductAggregate]:
+        """Assemble aggregates from loaded products, sibling previews and specifications."""
+        aggregates: Dict[int, ProductAggregate] = {}
+        for product_model in product_models:
+            specs_simple, specs_detailed = specifications[product_model.id]
+            aggregates[product_model.id] = ProductAggregate(
+                product=self._to_domain(product_model),
+                category=category_to_domain(product_model.category)
+                if product_model.category else None,
+                subcategories=[
+                    subcategory_to_domain(subcategory)
+                    for subcategory in product_model.subcategories.all()
+                ],
+                variants=[
+                    preview
+                    for preview in variant_previews.get(product_model.variant_group_id, [])
+                    if preview.id != product_model.id
+                ],
+                specifications=specs_simple,
+                specifications_detailed=specs_detailed
+            )
+        return aggregates
+    
+    def _variant_previews(self, variant_group_ids) -> Dict[int, List[VariantProductPreview]]:
+        """Previews of all members of the given variant groups, default first, then by id.
+        
+        Lists are cached per group until a member product or the group changes
+        (see ``invalidate_variant_previews``); only uncached groups are queried.
+        """
+        if not variant_group_ids:
+            return {}
+        
+        keys = {group_id: variant_previews_key(group_id) for group_id in variant_group_ids}
+        cached = shared_cache.get_many(list(keys.values()))
+        previews: Dict[int, List[VariantProductPreview]] = {
+            group_id: cached[key] for group_id, key in keys.items() if key in cached
+        }
+        missing = [group_id for group_id in keys if group_id not in previews]
+        CACHE_REQUESTS.inc(len(previews), cache='variant_previews', result='hit')
+        CACHE_REQUESTS.inc(len(missing), cache='variant_previews', result='miss')
+        if not missing:
+            return previews
+        
+        members = ProductModel.objects.filter(
+            variant_group_id__in=missing
+        ).annotate(
+            is_default=self._is_default_variant()
+        ).only(
+            'id', 'name', 'price', 'availability', 'variant_group_id',
+            'variant_image', 'variant_color_name', 'variant_color_palette'
+        ).order_by('variant_group_id', 'is_default', 'id')
+        
+        loaded: Dict[int, List[VariantProductPreview]] = {group_id: [] for group_id in missing}
+        for member in members:
+            loaded[member.variant_group_id].append(VariantProductPreview(
+                id=member.id,
+                name=member.name,
+                price=str(member.price),
+                availability=member.availability,
+                image=member.variant_image,
+                color_name=member.variant_color_name,
+                color_palette=member.variant_color_palette
+            ))
+        
+        shared_cache.set_many(
+            {keys[group_id]: group_previews for group_id, group_previews in loaded.items()},
+            settings.VARIANT_PREVIEW_CACHE_TIMEOUT
+        )
+        previews.update(loaded)
+        return previews
+    
+    @staticmethod
+    def _is_default_variant():
+        """0 for the default product of its variant group, 1 otherwise (for ordering)."""
+        return Case(
+            When(variant_group__default_product_id=F('id'), then=0),
+            default=1,
+            output_field=IntegerField()
+        )
+    
     def get_specifications(
         self,
         product_id: int
     ) -> Tuple[Dict[str, str], List[SpecificationDetail]]:
         """Get product specifications."""
-        # Get all attribute values for product
+        return self.get_specifications_bulk([product_id])[product_id]
+    
+    def get_specifications_bulk(
+        self,
+        product_ids: List[int]
+    ) -> Dict[int, Tuple[Dict[str, str], List[SpecificationDetail]]]:
+        """Get specifications for many products in a fixed number of queries."""
+        result: Dict[int, Tuple[Dict[str, str], List[SpecificationDetail]]] = {
+            product_id: ({}, []) for product_id in product_ids
+        }
+        if not product_ids:
+            return result
+        
+        # One query for values + attributes, one for selected options + options
         attr_values = ProductAttributeValueModel.objects.filter(
-            product_id=product_id
+            product_id__in=product_ids
         ).select_related('attribute').prefetch_related(
-            'selected_options__option'
-        )
-        
-        simple_record: Dict[str, str] = {}
-        detailed_list: List[SpecificationDetail] = []
+            Prefetch(
+                'selected_options',
+                queryset=ProductAttributeOptionModel.objects.select_related('option')
+            )
+        ).order_by('id')
         
         for attr_value in attr_values:
-            attr = attr_value.attribute
-            key = attr.key
-            label = attr.label
-            data_type = attr.data_type
-            unit = attr.unit
-            
-            # Get value based on data type
-            if data_type == AttributeModel.DataTypeChoices.TEXT:
-                value = attr_value.value_text
-                display = value or ''
-            elif data_type == AttributeModel.DataTypeChoices.NUMBER:
-                value = attr_value.value_number
-                display = str(value) if value is not None else ''
-            elif data_type == AttributeModel.DataTypeChoices.BOOLEAN:
-                value = attr_value.value_bool
-                display = '' if value is None else ('true' if value else 'false')
-            elif data_type == AttributeModel.DataTypeChoices.SINGLE_SELECT:
-                option = attr_value.selected_options.first()
-                if option:
-                    value = option.option.value
-                    display = option.option.label
-                else:
-                    value = None
-                    display = ''
-            elif data_type == AttributeModel.DataTypeChoices.MULTI_SELECT:
-                options = attr_value.selected_options.all()
-                if options:
-                    values = [opt.option.value for opt in options]
-                    labels = [opt.option.label for opt in options]
-                    value = ', '.join(values)
-                    display = ', '.join(labels)
-                else:
-                    value = None
-                    display = ''
+            simple_record, detailed_list = result[attr_value.product_id]
+            self._add_specification(attr_value, simple_record, detailed_list)
+        
+        return result
+    
+    def _add_specification(
+        self,
+        attr_value: ProductAttributeValueModel,
+        simple_record: Dict[str, str],
+        detailed_list: List[SpecificationDetail]
+    ) -> None:
+        """Append one attribute value to the simple record and detailed list."""
+        attr = attr_value.attribute
+        key = attr.key
+        label = attr.label
+        data_type = attr.data_type
+        unit = attr.unit
+        
+        # Get value based on data type
+        if data_type == AttributeModel.DataTypeChoices.TEXT:
+            value = attr_value.value_text
+            display = value or ''
+        elif data_type == AttributeModel.DataTypeChoices.NUMBER:
+            value = attr_value.value_number
+            display = str(value) if value is not None else ''
+        elif data_type == AttributeModel.DataTypeChoices.BOOLEAN:
+            value = attr_value.value_bool
+            display = '' if value is None else ('true' if value else 'false')
+        elif data_type == AttributeModel.DataTypeChoices.SINGLE_SELECT:
+            # Options are prefetched; pick the lowest pk like .first() without a query
+            options = attr_value.selected_options.all()
+            if options:
+                option = min(options, key=lambda opt: opt.id)
+                value = option.option.value
+                display = option.option.label
             else:
                 value = None
                 display = ''
-            
-            # Add to simple record
-            if value is not None:
-                simple_record[key] = str(display)
-            
-            # Add to detailed list
-            # Convert value to string for DTO
-            value_str = str(value) if value is not None else ''
-            detailed_list.append(SpecificationDetail(
-                key=key,
-                label=label,
-                type=data_type,
-                value=value_str,
-                display=display,
-                unit=unit
-            ))
+        elif data_type == AttributeModel.DataTypeChoices.MULTI_SELECT:
+            options = attr_value.selected_options.all()
+            if options:
+                values = [opt.option.value for opt in options]
+                labels = [opt.option.label for opt in options]
+                value = ', '.join(values)
+                display = ', '.join(labels)
+            else:
+                value = None
+                display = ''
+        else:
+            value = None
+            display = ''
+        
+        # Add to simple record
+        if value is not None:
+            simple_record[key] = str(display)
         
-        return simple_record, detailed_list
+        # Add to detailed list
+        # Convert value to string for DTO
+        value_str = str(value) if value is not None else ''
+        detailed_list.append(SpecificationDetail(
+            key=key,
+            label=label,
+            type=data_type,
+            value=value_str,
+            display=display,
+            unit=unit
+        ))
     
     def _to_domain(self, product_model: ProductModel) -> Product:
         """Convert Django model to domain entity."""
@@ -282,9 +760,10 @@ class DjangoProductRepository(ProductRepository):
             price_old=product_model.price_old,
             availability=Availability(product_model.availability),
             category_id=product_model.category_id,
-            subcategory_ids=list(
-                product_model.subcategories.values_list('id', flat=True)
-            ),
+            # Reads the prefetch cache when subcategories were prefetched
+            subcategory_ids=[
+                subcategory.id for subcategory in product_model.subcategories.all()
+            ],
             currency=Currency(product_model.currency),
             variant_group_id=product_model.variant_group_id,
             variant_color_name=product_model.variant_color_name,
@@ -293,3 +772,93 @@ class DjangoProductRepository(ProductRepository):
             created_at=product_model.created_at,
             updated_at=product_model.updated_at
         )
+
+
+class DjangoProductListingRepository(ProductListingRepository):
+    """Product list read model stored as one JSON payload per product.
+    
+    Pages are selected with the same filters, ordering and cached counts as
+    DjangoProductRepository, so a page costs one query plus the count.
+    """
+    
+    def __init__(self, list_query: Optional[ProductListQuery] = None):
+        self.list_query = list_query or ProductListQuery()
+    
+    def get_page(
+        self,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        estimate_total: bool = False
+    ) -> Optional[Tuple[List[ProductResponse], int]]:
+        """Get a page of list payloads, or None if the read model is incomplete."""
+        filters = {
+            'category_id': category_id,
+            'subcategory_ids': subcategory_ids,
+            'search': search,
+            'availability': availability,
+            'spec_filters': spec_filters,
+        }
+        queryset = self.list_query.filtered_queryset(**filters).select_related(
+            None
+        ).prefetch_related(None)
+        page_queryset, total = self.list_query.page(
+            queryset, filters, page, page_size, estimate_total
+        )
+        
+        payloads = [payload for _, payload in page_queryset.values_list('id', 'listing__payload')]
+        if any(payload is None for payload in payloads):
+            return None
+        return [self._from_payload(payload) for payload in payloads], total
+    
+    def save(self, products: List[ProductResponse]) -> None:
+        """Insert or replace list payloads."""
+        ProductListingModel.objects.bulk_create(
+            [
+                ProductListingModel(product_id=product.id, payload=self._to_payload(product))
+                for product in products
+            ],
+            update_conflicts=True,
+            unique_fields=['product'],
+            update_fields=['payload', 'updated_at'],
+        )
+    
+    def delete(self, product_ids: List[int]) -> None:
+        """Remove list payloads."""
+        ProductListingModel.objects.filter(product_id__in=product_ids).delete()
+    
+    @staticmethod
+    def _to_payload(product: ProductResponse) -> Dict:
+        """Serialize a list ProductResponse (variants are not stored)."""
+        payload = asdict(product)
+        del payload['variants']
+        for item in [payload, payload['category'], *payload['subcategories']]:
+            if item is not None:
+                item['created_at'] = item['created_at'].isoformat()
+        payload['updated_at'] = product.updated_at.isoformat()
+        return payload
+    
+    @staticmethod
+    def _from_payload(payload: Dict) -> ProductResponse:
+        """Rebuild a list ProductResponse from its stored payload."""
+        data = dict(payload)
+        category = data['category']
+        data['category'] = CategoryResponse(
+            **{**category, 'created_at': datetime.fromisoformat(category['created_at'])}
+        ) if category else None
+        data['subcategories'] = [
+            SubcategoryResponse(
+                **{**sub, 'created_at': datetime.fromisoformat(sub['created_at'])}
+            )
+            for sub in data['subcategories']
+        ]
+        data['specifications_detailed'] = [
+            SpecificationDetail(**spec) for spec in data['specifications_detailed']
+        ]
+        data['created_at'] = datetime.fromisoformat(data['created_at'])
+        data['updated_at'] = datetime.fromisoformat(data['updated_at'])
+        return ProductResponse(variants=[], **data)
@@ -1,15 +1,21 @@
 """Homepage repository implementation."""
 from typing import List, Dict
-from django.db.models import Prefetch
+from django.db.models import F, Prefetch, OuterRef, Subquery, Window
+from django.db.models.functions import RowNumber
 from src.domain.homepage.entities import HomeSection, HomeSectionItem
 from src.domain.catalog.entities import Product
 from src.domain.shared.types import Currency, Availability
 from src.application.homepage.ports import HomeSectionRepository, ProductCardRepository
+from src.application.homepage.dto import FeaturedProduct
 from src.infrastructure.db.models.homepage import (
     HomeSection as HomeSectionModel,
     HomeSectionItem as HomeSectionItemModel
 )
-from src.infrastructure.db.models.catalog import Product as ProductModel
+from src.infrastructure.db.models.catalog import (
+    Product as ProductModel,
+    ProductVariant as ProductVariantModel,
+    Subcategory as SubcategoryModel
+)
 
 
 class DjangoHomeSectionRepository(HomeSectionRepository):
@@ -27,12 +33,22 @@ class DjangoHomeSectionRepository(HomeSectionRepository):
         self,
         section_ids: List[int]
     ) -> Dict[int, List[HomeSectionItem]]:
-        """Get all section items for given sections."""
+        """Get the first product_count items of each given section."""
         if not section_ids:
             return {}
         
+        # ROW_NUMBER() OVER (PARTITION BY section_id ...) <= product_count,
+        # so items beyond what a section renders are never fetched
         items = HomeSectionItemModel.objects.filter(
             section_id__in=section_ids
+        ).annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=[F('section_id')],
+                order_by=[F('sort_order').asc(), F('id').asc()]
+            )
+        ).filter(
+            position__lte=F('section__product_count')
         ).order_by('section_id', 'sort_order', 'id')
         
         # Group by section_id
@@ -77,47 +93,42 @@ class DjangoProductCardRepository(ProductCardRepository):
     def get_product_cards(
         self,
         product_ids: List[int]
-    ) -> List[Product]:
-        """Get products by IDs in the same order as provided."""
+    ) -> List[FeaturedProduct]:
+        """Get products with primary images by IDs in the same order as provided.
+        
+        The first variant image is selected in the product query and
+        subcategory ids come from one prefetch, so any number of products
+        costs two queries.
+        """
         if not product_ids:
             return []
         
-        # Fetch products
-        product_models = ProductModel.objects.filter(
-            id__in=product_ids
-        ).select_related('category').prefetch_related('subcategories')
-        
-        # Fetch first variant image URLs for each product
-        from src.infrastructure.db.models.catalog import ProductVariant as ProductVariantModel
-        
-        # Get first variant (by sort_order) with image for each product
-        # Fetch all variants with images, then pick first per product
-        all_variants = ProductVariantModel.objects.filter(
-            product_id__in=product_ids,
+        # First variant (by sort_order) with an image
+        first_image = ProductVariantModel.objects.filter(
+            product_id=OuterRef('pk'),
             image_url__isnull=False
-        ).order_by('product_id', 'sort_order', 'id')
+        ).order_by('sort_order', 'id').values('image_url')[:1]
         
-        # Create image URL map (first variant per product)
-        image_urls = {}
-        seen_products = set()
-        for variant in all_variants:
-            if variant.product_id not in seen_products:
-                image_urls[variant.product_id] = variant.image_url
-                seen_products.add(variant.product_id)
+        product_models = ProductModel.objects.filter(
+            id__in=product_ids
+        ).annotate(
+            primary_image_url=Subquery(first_image)
+        ).prefetch_related(
+            Prefetch('subcategories', queryset=SubcategoryModel.objects.only('id'))
+        )
         
         # Create lookup map
         product_map = {p.id: p for p in product_models}
         
         # Return in the same order as product_ids, filtering out missing ones
-        products = []
-        for pid in product_ids:
-            if pid in product_map:
-                product = self._to_domain(product_map[pid])
-                # Attach image URL as a temporary attribute (not part of domain model)
-                product._image_url = image_urls.get(pid)  # type: ignore
-                products.append(product)
-        
-        return products
+        return [
+            FeaturedProduct(
+                product=self._to_domain(product_map[pid]),
+                image_url=product_map[pid].primary_image_url
+            )
+            for pid in product_ids
+            if pid in product_map
+        ]
     
     def _to_domain(self, product_model: ProductModel) -> Product:
         """Convert Django model to domain entity."""
@@ -130,10 +141,12 @@ class DjangoProductCardRepository(ProductCardRepository):
             price_old=product_model.price_old,
             availability=Availability(product_model.availability),
             category_id=product_model.category_id,
-            subcategory_ids=list(
-                product_model.subcategories.values_list('id', flat=True)
-            ),
+            subcategory_ids=[s.id for s in product_model.subcategories.all()],
             currency=Currency(product_model.currency),
+            variant_group_id=product_model.variant_group_id,
+            variant_color_name=product_model.variant_color_name,
+            variant_color_palette=product_model.variant_color_palette,
+            variant_image=product_model.variant_image,
             created_at=product_model.created_at,
             updated_at=product_model.updated_at
         )
@@ -0,0 +1,138 @@
+"""Filtered product listing queries.
+
+Builds the product queryset for the listing filters, counts it (cached
+until the catalog changes) and slices offset pages. Shared by the product
+repository and the product list read model so both select the same rows in
+the same order.
+"""
+import hashlib
+import json
+from math import ceil
+from typing import Optional, List, Dict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from src.infrastructure.cache.versions import CATALOG_VERSION
+from src.infrastructure.metrics.collector import CACHE_REQUESTS
+from src.infrastructure.db.repositories.spec_filters import AttributeIndex, SpecFilterCompiler
+from src.infrastructure.search.backends import ProductSearchBackend, get_search_backend
+from src.infrastructure.db.models.catalog import Product as ProductModel
+
+
+class ProductListQuery:
+    """Product listing filters, counts and offset pages."""
+    
+    def __init__(
+        self,
+        spec_filter_compiler: Optional[SpecFilterCompiler] = None,
+        search_backend: Optional[ProductSearchBackend] = None
+    ):
+        self.spec_filter_compiler = spec_filter_compiler or SpecFilterCompiler(AttributeIndex())
+        self._search_backend = search_backend
+    
+    @property
+    def search_backend(self) -> ProductSearchBackend:
+        """Search backend, resolved lazily since it depends on the DB vendor."""
+        if self._search_backend is None:
+            self._search_backend = get_search_backend()
+        return self._search_backend
+    
+    def filtered_queryset(
+        self,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        availability: Optional[str] = None,
+        spec_filters: Optional[Dict[str, str]] = None
+    ):
+        """Build the product queryset for the listing filters."""
+        queryset = ProductModel.objects.select_related('category').prefetch_related(
+            'subcategories'
+        )
+        
+        # Apply filters
+        if category_id:
+            queryset = queryset.filter(category_id=category_id)
+        if subcategory_ids:
+            # The M2M join is the only filter that can duplicate rows
+            queryset = queryset.filter(subcategories__id__in=subcategory_ids).distinct()
+        if search:
+            queryset = self.search_backend.filter(queryset, search)
+        if availability:
+            queryset = queryset.filter(availability=availability)
+        
+        # Apply spec filters (one EXISTS per filter, no extra joins)
+        if spec_filters:
+            queryset = queryset.filter(*self.spec_filter_compiler.compile(
+                spec_filters,
+                category_id=category_id,
+                subcategory_ids=subcategory_ids
+            ))
+        
+        return queryset
+    
+    def page(self, queryset, filters: Dict, page: int, page_size: int, estimate_total: bool):
+        """Return the slice of a filtered queryset for an offset page and the total count."""
+        
+        # Count once and clamp the page the same way Paginator.get_page does
+        total = self.count(queryset, filters, estimate_total)
+        num_pages = max(1, ceil(total / page_size))
+        page = min(max(page, 1), num_pages)
+        offset = (page - 1) * page_size
+        
+        # Best matches first when searching
+        if filters.get('search'):
+            queryset = self.search_backend.order_by_rank(queryset, filters['search'])
+        
+        return queryset[offset:offset + page_size], total
+    
+    def count(self, queryset, filters: Dict, estimate: bool) -> int:
+        """Count the filtered products, cached until the catalog changes.
+        
+        With ``estimate`` the Postgres planner row estimate is used for broad
+        queries instead of an exact COUNT(DISTINCT ...).
+        """
+        cache_key = CATALOG_VERSION.make_key(
+            'product_count',
+            'estimate' if estimate else 'exact',
+            self.filter_signature(filters)
+        )
+        total = cache.get(cache_key)
+        CACHE_REQUESTS.inc(cache='product_count', result='miss' if total is None else 'hit')
+        if total is not None:
+            return total
+        
+        total = self._estimate_count(queryset) if estimate else None
+        if total is None:
+            total = queryset.count()
+        
+        cache.set(cache_key, total, getattr(settings, 'PRODUCT_COUNT_CACHE_TIMEOUT', 600))
+        return total
+    
+    def filter_signature(self, filters: Dict) -> str:
+        """Stable hash of the listing filters (order-insensitive, without paging)."""
+        normalized = {
+            'category_id': filters.get('category_id'),
+            'subcategory_ids': sorted(set(filters.get('subcategory_ids') or [])),
+            'search': filters.get('search') or None,
+            'availability': filters.get('availability') or None,
+            'spec_filters': sorted((filters.get('spec_filters') or {}).items()),
+        }
+        raw = json.dumps(normalized, sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode()).hexdigest()
+    
+    def _estimate_count(self, queryset) -> Optional[int]:
+        """Return the planner row estimate if it is large enough to trust.
+        
+        Small estimates (and non-Postgres databases) return None so the caller
+        falls back to an exact count.
+        """
+        if connection.vendor != 'postgresql':
+            return None
+        
+        plan = json.loads(queryset.values('id').explain(format='json'))
+        rows = int(plan[0]['Plan']['Plan Rows'])
+        threshold = getattr(settings, 'PRODUCT_COUNT_ESTIMATE_THRESHOLD', 1000)
+        return rows if rows >= threshold else None
@@ -0,0 +1,236 @@
+"""Spec filter compiler for product listings.
+
+Turns ``spec_<key>[__<op>]=<value>`` query filters into one ``EXISTS``
+subquery per filter, resolving attribute keys from an in-memory index of
+attribute definitions instead of querying ``attributes`` per filter.
+"""
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Optional, List, Dict, Tuple, NamedTuple
+
+from django.db.models import Q, Exists, OuterRef
+
+from src.infrastructure.cache.versions import VersionStamp, ATTRIBUTE_VERSION
+from src.infrastructure.db.models.catalog import (
+    Subcategory as SubcategoryModel,
+    Attribute as AttributeModel,
+    ProductAttributeValue as ProductAttributeValueModel,
+)
+
+
+DataType = AttributeModel.DataTypeChoices
+ScopeTypeChoice = AttributeModel.ScopeTypeChoices
+
+# Supported operators per data type; None is the operator-less form
+OPERATORS = {
+    DataType.TEXT: {None, 'icontains', 'contains', 'exact', 'iexact'},
+    DataType.NUMBER: {None, 'exact', 'gt', 'gte', 'lt', 'lte'},
+    DataType.BOOLEAN: {None, 'exact'},
+    DataType.SINGLE_SELECT: {None, 'exact'},
+    DataType.MULTI_SELECT: {None, 'exact'},
+}
+ALL_OPERATORS = set().union(*OPERATORS.values()) - {None}
+
+
+@dataclass(frozen=True)
+class AttributeMeta:
+    """Attribute definition fields needed to compile filters and facets."""
+    id: int
+    scope_type: str
+    scope_id: int
+    key: str
+    data_type: str
+    label: str
+    unit: Optional[str]
+    is_filterable: bool
+    sort_order: int
+
+
+class _IndexSnapshot(NamedTuple):
+    """Attribute definitions indexed for filter resolution."""
+    version: int
+    by_id: Dict[int, AttributeMeta]
+    by_scope: Dict[Tuple[str, int, str], AttributeMeta]
+    by_key: Dict[str, List[AttributeMeta]]
+    subcategory_parents: Dict[int, int]
+
+
+class AttributeIndex:
+    """In-memory ``(scope_type, scope_id, key)`` index of attribute definitions."""
+    
+    def __init__(self, version: VersionStamp = ATTRIBUTE_VERSION):
+        self.version = version
+        self._snapshot: Optional[_IndexSnapshot] = None
+    
+    def resolve(
+        self,
+        key: str,
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None
+    ) -> List[AttributeMeta]:
+        """Find the attributes a filter key refers to.
+        
+        When a category or subcategories are requested, only attributes
+        scoped to them (or to the subcategories' parent categories) are
+        used; otherwise, or if none of those define the key, every attribute
+        with the key matches.
+        """
+        snapshot = self._get_snapshot()
+        
+        scopes = []
+        if category_id:
+            scopes.append((ScopeTypeChoice.CATEGORY, category_id))
+        for subcategory_id in subcategory_ids or []:
+            scopes.append((ScopeTypeChoice.SUBCATEGORY, subcategory_id))
+            parent_id = snapshot.subcategory_parents.get(subcategory_id)
+            if parent_id:
+                scopes.append((ScopeTypeChoice.CATEGORY, parent_id))
+        
+        attributes: List[AttributeMeta] = []
+        for scope_type, scope_id in scopes:
+            attribute = snapshot.by_scope.get((scope_type, scope_id, key))
+            if attribute and attribute not in attributes:
+                attributes.append(attribute)
+        
+        return attributes or list(snapshot.by_key.get(key, []))
+    
+    def filterable(self) -> List[AttributeMeta]:
+        """All filterable attributes, ordered by sort_order and key."""
+        return sorted(
+            (attribute for attribute in self._get_snapshot().by_id.values() if attribute.is_filterable),
+            key=lambda attribute: (attribute.sort_order, attribute.key, attribute.id)
+        )
+    
+    def _get_snapshot(self) -> _IndexSnapshot:
+        """Return the current snapshot, reloading it if the version moved."""
+        version = self.version.get()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        
+        by_id: Dict[int, AttributeMeta] = {}
+        by_scope: Dict[Tuple[str, int, str], AttributeMeta] = {}
+        by_key: Dict[str, List[AttributeMeta]] = {}
+        for row in AttributeModel.objects.values_list(
+            'id', 'scope_type', 'scope_id', 'key', 'data_type',
+            'label', 'unit', 'is_filterable', 'sort_order'
+        ).order_by('id'):
+            attribute = AttributeMeta(*row)
+            by_id[attribute.id] = attribute
+            by_scope[(attribute.scope_type, attribute.scope_id, attribute.key)] = attribute
+            by_key.setdefault(attribute.key, []).append(attribute)
+        
+        snapshot = _IndexSnapshot(
+            version=version,
+            by_id=by_id,
+            by_scope=by_scope,
+            by_key=by_key,
+            subcategory_parents=dict(
+                SubcategoryModel.objects.values_list('id', 'category_id')
+            ),
+        )
+        self._snapshot = snapshot
+        return snapshot
+
+
+class SpecFilterCompiler:
+    """Compile spec filters into independent EXISTS expressions.
+    
+    Supported forms:
+        ``material=leather``               TEXT contains (default)
+        ``material=cotton,polyester``      any of several values
+        ``material__exact=Cotton``         exact text (also ``iexact``)
+        ``cord_diameter_mm__gte=3``        NUMBER ranges (``gt``, ``lt``, ``lte``)
+        ``waterproof=true``                BOOLEAN
+        ``color=red,blue``                 SELECT option values
+    
+    Unknown keys, unsupported operators and unparsable values are ignored.
+    """
+    
+    def __init__(self, index: AttributeIndex):
+        self.index = index
+    
+    def compile(
+        self,
+        spec_filters: Dict[str, str],
+        category_id: Optional[int] = None,
+        subcategory_ids: Optional[List[int]] = None
+    ) -> List[Exists]:
+        """Compile filters into expressions to pass to ``QuerySet.filter``."""
+        expressions = []
+        for raw_key, raw_value in spec_filters.items():
+            key, op = self._split_operator(raw_key)
+            values = [value.strip() for value in str(raw_value).split(',') if value.strip()]
+            if not values:
+                continue
+            
+            attributes = self.index.resolve(key, category_id, subcategory_ids)
+            
+            # Attributes sharing a key may differ in type across scopes
+            by_type: Dict[str, List[int]] = {}
+            for attribute in attributes:
+                by_type.setdefault(attribute.data_type, []).append(attribute.id)
+            
+            condition = Q()
+            for data_type, attribute_ids in by_type.items():
+                value_condition = self._value_condition(data_type, op, values)
+                if value_condition is not None:
+                    condition |= Q(attribute_id__in=attribute_ids) & value_condition
+            
+            if not condition:
+                continue
+            
+            expressions.append(Exists(
+                ProductAttributeValueModel.objects.filter(
+                    condition,
+                    product_id=OuterRef('pk')
+                )
+            ))
+        return expressions
+    
+    def _split_operator(self, raw_key: str) -> Tuple[str, Optional[str]]:
+        """Split ``key__op`` into key and operator."""
+        key, separator, op = raw_key.rpartition('__')
+        if separator and key and op in ALL_OPERATORS:
+            return key, op
+        return raw_key, None
+    
+    def _value_condition(
+        self,
+        data_type: str,
+        op: Optional[str],
+        values: List[str]
+    ) -> Optional[Q]:
+        """Build the value condition for one data type, or None if invalid."""
+        if op not in OPERATORS.get(data_type, set()):
+            return None
+        
+        if data_type == DataType.TEXT:
+            lookup = op or 'icontains'
+            if lookup == 'exact':
+                return Q(value_text__in=values)
+            condition = Q()
+            for value in values:
+                condition |= Q(**{f'value_text__{lookup}': value})
+            return condition
+        
+        if data_type == DataType.NUMBER:
+            try:
+                numbers = [Decimal(value) for value in values]
+            except (InvalidOperation, ValueError, TypeError):
+                return None
+            # 'inf' and 'NaN' parse, but cannot be stored in a DecimalField
+            if not all(number.is_finite() for number in numbers):
+                return None
+            if op in (None, 'exact'):
+                return Q(value_number__in=numbers)
+            if len(numbers) != 1:
+                # A range bound takes exactly one number
+                return None
+            return Q(**{f'value_number__{op}': numbers[0]})
+        
+        if data_type == DataType.BOOLEAN:
+            return Q(value_bool=values[0].lower() in ('true', '1', 'yes'))
+        
+        # SINGLE_SELECT / MULTI_SELECT
+        return Q(selected_options__option__value__in=values)
@@ -0,0 +1,92 @@
+"""Database routers."""
+import random
+import time
+
+from asgiref.local import Local
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from src.infrastructure.cache.versions import (
+    CATEGORY_VERSION, ATTRIBUTE_VERSION, CATALOG_VERSION, HOMEPAGE_VERSION, get_versions
+)
+
+
+# Models whose reads may be served by a replica
+_REPLICATED_MODULES = frozenset({
+    'src.infrastructure.db.models.catalog',
+    'src.infrastructure.db.models.homepage',
+})
+
+# Stamps of everything replicated; cached data is keyed by them
+_STAMPS = (CATEGORY_VERSION, ATTRIBUTE_VERSION, CATALOG_VERSION, HOMEPAGE_VERSION)
+
+_request_state = Local()
+
+
+def begin_replica_reads(pinned: bool) -> None:
+    """Allow replica reads for the current request unless ``pinned`` to the primary."""
+    _request_state.replica_reads = not pinned
+    _request_state.wrote = False
+
+
+def end_replica_reads() -> bool:
+    """Stop replica reads for the current request; returns whether it wrote."""
+    wrote = getattr(_request_state, 'wrote', False)
+    _request_state.replica_reads = False
+    _request_state.wrote = False
+    return wrote
+
+
+def _recently_bumped() -> bool:
+    """Whether any stamp moved within the replica lag allowance.
+    
+    Stamps are nanosecond timestamps. Until a replica can be assumed to have
+    caught up with the write behind a bump, a read from it could store
+    pre-write data in caches keyed by the new stamp (and behind its ETag).
+    The stamps are read once per request (memoized by ``get_versions``).
+    """
+    horizon = time.time_ns() - settings.DATABASE_REPLICA_STICKY_SECONDS * 1_000_000_000
+    return any(version > horizon for version in get_versions(_STAMPS))
+
+
+class ReadReplicaRouter:
+    """Send catalog and homepage reads made while serving requests to replicas.
+    
+    Writes and all other models (users, addresses, auth, sessions) use the
+    primary, and so do reads inside a transaction, reads after a write in
+    the same request, reads outside requests (management commands, shell),
+    requests from clients pinned after a recent write, and every request for
+    ``DATABASE_REPLICA_STICKY_SECONDS`` after a catalog version stamp moved.
+    """
+    
+    def __init__(self):
+        self.replicas = list(settings.DATABASE_REPLICAS)
+    
+    def db_for_read(self, model, **hints):
+        """Pick a replica for catalog/homepage reads when that is safe."""
+        if (
+            not self.replicas
+            or model.__module__ not in _REPLICATED_MODULES
+            or not getattr(_request_state, 'replica_reads', False)
+            or getattr(_request_state, 'wrote', False)
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        if _recently_bumped():
+            # Stay on the primary for the rest of the request
+            _request_state.replica_reads = False
+            return DEFAULT_DB_ALIAS
+        return random.choice(self.replicas)
+    
+    def db_for_write(self, model, **hints):
+        """Write to the primary; later reads in this request follow it there."""
+        _request_state.wrote = True
+        return DEFAULT_DB_ALIAS
+    
+    def allow_relation(self, obj1, obj2, **hints):
+        """Replicas hold the same rows as the primary."""
+        return True
+    
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """Only migrate the primary; replicas follow through replication."""
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,285 @@
+"""Model signal handlers that keep caches, search documents and read models in sync with the database."""
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+
+from src.infrastructure.cache.versions import (
+    CATEGORY_VERSION, ATTRIBUTE_VERSION, CATALOG_VERSION, HOMEPAGE_VERSION
+)
+from src.infrastructure.cache.variants import invalidate_variant_previews
+from src.infrastructure.search.backends import get_search_backend
+from src.infrastructure.db.models.catalog import (
+    Category, Subcategory, VariantGroup, Product, ProductVariant,
+    Attribute, AttributeOption, ProductAttributeValue, ProductAttributeOption
+)
+from src.infrastructure.db.models.homepage import HomeSection, HomeSectionItem
+
+
+_CATALOG_MODELS = [
+    Category, Subcategory, VariantGroup, Product, ProductVariant,
+    Attribute, AttributeOption, ProductAttributeValue, ProductAttributeOption,
+]
+
+
+@receiver([post_save, post_delete], sender=Category, dispatch_uid='category_version_category')
+@receiver([post_save, post_delete], sender=Subcategory, dispatch_uid='category_version_subcategory')
+def bump_category_version(sender, **kwargs):
+    """Invalidate cached category trees."""
+    CATEGORY_VERSION.bump()
+
+
+@receiver([post_save, post_delete], sender=Attribute, dispatch_uid='attribute_version_attribute')
+@receiver([post_save, post_delete], sender=Subcategory, dispatch_uid='attribute_version_subcategory')
+def bump_attribute_version(sender, **kwargs):
+    """Invalidate the attribute index used by spec filters."""
+    ATTRIBUTE_VERSION.bump()
+
+
+def bump_catalog_version(sender, **kwargs):
+    """Invalidate caches derived from catalog data (counts, listings)."""
+    CATALOG_VERSION.bump()
+
+
+for _model in _CATALOG_MODELS:
+    post_save.connect(
+        bump_catalog_version, sender=_model,
+        dispatch_uid=f'catalog_version_save_{_model.__name__}'
+    )
+    post_delete.connect(
+        bump_catalog_version, sender=_model,
+        dispatch_uid=f'catalog_version_delete_{_model.__name__}'
+    )
+
+
+@receiver(m2m_changed, sender=Product.subcategories.through, dispatch_uid='catalog_version_product_subcategories')
+def bump_catalog_version_on_subcategories(sender, action, **kwargs):
+    """Invalidate catalog caches when product subcategories change."""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        CATALOG_VERSION.bump()
+
+
+@receiver(pre_save, sender=Product, dispatch_uid='variant_previews_product_pre_save')
+def remember_previous_variant_group(sender, instance, raw=False, **kwargs):
+    """Remember the stored variant group so a product moving groups clears both."""
+    if raw or instance.pk is None:
+        return
+    instance._previous_variant_group_id = (
+        Product.objects.filter(pk=instance.pk).values_list('variant_group_id', flat=True).first()
+    )
+
+
+@receiver([post_save, post_delete], sender=Product, dispatch_uid='variant_previews_product')
+def invalidate_product_variant_previews(sender, instance, **kwargs):
+    """Drop cached sibling previews of the product's variant group(s)."""
+    invalidate_variant_previews([
+        instance.variant_group_id,
+        getattr(instance, '_previous_variant_group_id', None),
+    ])
+
+
+@receiver([post_save, post_delete], sender=VariantGroup, dispatch_uid='variant_previews_group')
+def invalidate_group_variant_previews(sender, instance, **kwargs):
+    """Drop cached previews when the group (e.g. its default product) changes."""
+    invalidate_variant_previews([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=HomeSection, dispatch_uid='homepage_version_section')
+@receiver([post_save, post_delete], sender=HomeSectionItem, dispatch_uid='homepage_version_item')
+def bump_homepage_version(sender, **kwargs):
+    """Invalidate data derived from homepage sections."""
+    HOMEPAGE_VERSION.bump()
+
+
+# Search documents: affected product ids are collected per thread and
+# re-indexed once after the surrounding transaction commits.
+_pending_search = threading.local()
+
+
+def _queue_search_index(product_ids):
+    """Schedule a search document refresh for products after commit."""
+    product_ids = set(product_ids)
+    if not product_ids:
+        return
+    pending = getattr(_pending_search, 'ids', None)
+    if pending is None:
+        pending = _pending_search.ids = set()
+    pending.update(product_ids)
+    # Same draining scheme as _queue_listing_refresh below
+    transaction.on_commit(_flush_search_index)
+
+
+def _flush_search_index():
+    """Re-index queued products that still exist and drop the others."""
+    pending = getattr(_pending_search, 'ids', None)
+    if not pending:
+        return
+    _pending_search.ids = set()
+    
+    existing = set(Product.objects.filter(id__in=pending).values_list('id', flat=True))
+    backend = get_search_backend()
+    if existing:
+        backend.index_products(sorted(existing))
+    if pending - existing:
+        backend.remove_products(sorted(pending - existing))
+
+
+@receiver([post_save, post_delete], sender=Product, dispatch_uid='search_index_product')
+def index_product(sender, instance, **kwargs):
+    """Refresh the search document of a saved or deleted product."""
+    _queue_search_index([instance.id])
+
+
+@receiver([post_save, post_delete], sender=ProductAttributeValue, dispatch_uid='search_index_attribute_value')
+def index_attribute_value_product(sender, instance, **kwargs):
+    """Refresh the search document when a product's attribute values change."""
+    _queue_search_index([instance.product_id])
+
+
+@receiver(pre_save, sender=Attribute, dispatch_uid='search_index_attribute_pre_save')
+def remember_previous_data_type(sender, instance, raw=False, **kwargs):
+    """Remember the stored data type so a change to or from TEXT re-indexes."""
+    if raw or instance.pk is None:
+        return
+    instance._previous_data_type = (
+        Attribute.objects.filter(pk=instance.pk).values_list('data_type', flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Attribute, dispatch_uid='search_index_attribute')
+def index_attribute_products(sender, instance, created, **kwargs):
+    """Re-index products using an attribute whose values enter or leave search documents."""
+    if created:
+        return
+    text = Attribute.DataTypeChoices.TEXT
+    previous = getattr(instance, '_previous_data_type', None)
+    if previous != instance.data_type and text in (previous, instance.data_type):
+        _queue_search_index(
+            ProductAttributeValue.objects.filter(
+                attribute_id=instance.id
+            ).values_list('product_id', flat=True)
+        )
+
+
+# Product list read model: affected product ids are collected per thread and
+# refreshed once after the surrounding transaction commits.
+_pending_listings = threading.local()
+
+
+def _queue_listing_refresh(product_ids):
+    """Schedule a read-model refresh for products after commit."""
+    if not settings.PRODUCT_READ_MODEL_ENABLED:
+        return
+    product_ids = set(product_ids)
+    if not product_ids:
+        return
+    pending = getattr(_pending_listings, 'ids', None)
+    if pending is None:
+        pending = _pending_listings.ids = set()
+    pending.update(product_ids)
+    # Every registration drains the shared set; later callbacks find it empty.
+    # Ids left behind by a rolled-back transaction are refreshed harmlessly
+    # with the next commit.
+    transaction.on_commit(_flush_listing_refresh)
+
+
+def _flush_listing_refresh():
+    """Refresh read-model payloads for all queued products."""
+    pending = getattr(_pending_listings, 'ids', None)
+    if not pending:
+        return
+    _pending_listings.ids = set()
+    
+    from src.application.catalog.use_cases import RefreshProductListingsUseCase
+    from src.infrastructure.cache.catalog_repo import CachedCategoryRepository
+    from src.infrastructure.db.repositories.catalog_repo import (
+        DjangoCategoryRepository, DjangoProductRepository, DjangoProductListingRepository
+    )
+    product_repo = DjangoProductRepository()
+    # Categories are loaded once for the batch, not per product
+    RefreshProductListingsUseCase(
+        product_repo,
+        CachedCategoryRepository(DjangoCategoryRepository()),
+        DjangoProductListingRepository(product_repo.list_query)
+    ).execute(sorted(pending))
+
+
+@receiver(post_save, sender=Product, dispatch_uid='listing_product_save')
+def refresh_product_listing(sender, instance, **kwargs):
+    """Refresh the list payload of a saved product."""
+    _queue_listing_refresh([instance.id])
+
+
+@receiver(m2m_changed, sender=Product.subcategories.through, dispatch_uid='listing_product_subcategories')
+def refresh_listing_on_subcategories(sender, instance, action, reverse, pk_set, **kwargs):
+    """Refresh list payloads when product subcategories change."""
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            _queue_listing_refresh([instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        _queue_listing_refresh(pk_set)
+    elif action == 'pre_clear':
+        _queue_listing_refresh(instance.products.values_list('id', flat=True))
+
+
+@receiver([post_save, post_delete], sender=ProductAttributeValue, dispatch_uid='listing_attribute_value')
+def refresh_listing_on_attribute_value(sender, instance, **kwargs):
+    """Refresh the list payload when a product's attribute values change."""
+    _queue_listing_refresh([instance.product_id])
+
+
+@receiver([post_save, post_delete], sender=ProductAttributeOption, dispatch_uid='listing_attribute_option')
+def refresh_listing_on_selected_option(sender, instance, **kwargs):
+    """Refresh the list payload when selected options change."""
+    # The attribute value may already be gone during a cascade delete;
+    # its own post_delete queues the product in that case.
+    _queue_listing_refresh(
+        ProductAttributeValue.objects.filter(
+            id=instance.product_attribute_value_id
+        ).values_list('product_id', flat=True)
+    )
+
+
+@receiver(pre_delete, sender=VariantGroup, dispatch_uid='listing_variant_group')
+def refresh_listing_on_variant_group_delete(sender, instance, **kwargs):
+    """Refresh list payloads of members of a deleted variant group.
+    
+    Its products are detached with a SQL update that fires no Product signals.
+    """
+    _queue_listing_refresh(instance.products.values_list('id', flat=True))
+
+
+@receiver(post_save, sender=Category, dispatch_uid='listing_category')
+def refresh_listing_on_category(sender, instance, **kwargs):
+    """Refresh list payloads embedding a renamed category."""
+    _queue_listing_refresh(
+        Product.objects.filter(category_id=instance.id).values_list('id', flat=True)
+    )
+
+
+@receiver([post_save, pre_delete], sender=Subcategory, dispatch_uid='listing_subcategory')
+def refresh_listing_on_subcategory(sender, instance, **kwargs):
+    """Refresh list payloads embedding a changed or deleted subcategory."""
+    _queue_listing_refresh(instance.products.values_list('id', flat=True))
+
+
+@receiver(post_save, sender=Attribute, dispatch_uid='listing_attribute')
+def refresh_listing_on_attribute(sender, instance, **kwargs):
+    """Refresh list payloads whose specifications use a changed attribute."""
+    _queue_listing_refresh(
+        ProductAttributeValue.objects.filter(
+            attribute_id=instance.id
+        ).values_list('product_id', flat=True)
+    )
+
+
+@receiver(post_save, sender=AttributeOption, dispatch_uid='listing_attribute_option_label')
+def refresh_listing_on_option(sender, instance, **kwargs):
+    """Refresh list payloads showing a changed option."""
+    _queue_listing_refresh(
+        ProductAttributeOption.objects.filter(
+            option_id=instance.id
+        ).values_list('product_attribute_value__product_id', flat=True)
+    )
@@ -0,0 +1,355 @@
+"""Tests for catalog repositories (query budgets, spec filters, the read model,
+search indexing) and the read replica router.
+
+Run with ``python manage.py test src.infrastructure.db``.
+"""
+import time
+from decimal import Decimal
+
+from django.core.cache import caches
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from src.infrastructure.db.models.catalog import (
+    Category,
+    Subcategory,
+    VariantGroup,
+    Product,
+    Attribute,
+    AttributeOption,
+    ProductAttributeValue,
+    ProductAttributeOption,
+    ProductListing,
+)
+from src.infrastructure.cache.versions import CATALOG_VERSION, HOMEPAGE_VERSION, shared_cache
+from src.infrastructure.db.repositories.catalog_repo import DjangoProductRepository
+from src.infrastructure.db.models.users import User
+from src.infrastructure.db.routers import (
+    ReadReplicaRouter, begin_replica_reads, end_replica_reads, _STAMPS
+)
+from interfaces.rest.shared.middleware import ReplicaStickinessMiddleware
+
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'shared',
+    },
+}
+
+
+def clear_caches():
+    for alias in LOCMEM_CACHES:
+        caches[alias].clear()
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ProductAggregateQueryCountTests(TestCase):
+    """``get_aggregates`` loads product details in a fixed number of queries."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Bags', slug='bags')
+        subcategories = [
+            Subcategory.objects.create(category=category, name=name, slug=name.lower())
+            for name in ('Cross', 'Shoulder', 'Tote')
+        ]
+        material = Attribute.objects.create(
+            scope_type='category', scope_id=category.id, key='material',
+            label='Material', data_type='TEXT'
+        )
+        width = Attribute.objects.create(
+            scope_type='category', scope_id=category.id, key='width_cm',
+            label='Width', data_type='NUMBER', unit='cm'
+        )
+        color = Attribute.objects.create(
+            scope_type='category', scope_id=category.id, key='color',
+            label='Color', data_type='MULTI_SELECT'
+        )
+        color_options = [
+            AttributeOption.objects.create(attribute=color, value=value, label=value.title())
+            for value in ('red', 'blue')
+        ]
+        
+        group = VariantGroup.objects.create(name='Crossbody', slug='crossbody')
+        cls.products = []
+        for index, color_name in enumerate(('Red', 'Blue', 'Black')):
+            product = Product.objects.create(
+                name=f'Crossbody {color_name}',
+                price=Decimal('49.00'),
+                category=category,
+                variant_group=group,
+                variant_color_name=color_name
+            )
+            product.subcategories.set(subcategories)
+            ProductAttributeValue.objects.create(
+                product=product, attribute=material, value_text='leather'
+            )
+            ProductAttributeValue.objects.create(
+                product=product, attribute=width, value_number=Decimal(20 + index)
+            )
+            selected = ProductAttributeValue.objects.create(product=product, attribute=color)
+            for option in color_options:
+                ProductAttributeOption.objects.create(
+                    product_attribute_value=selected, option=option
+                )
+            cls.products.append(product)
+    
+    def setUp(self):
+        clear_caches()
+        self.repo = DjangoProductRepository()
+    
+    def test_single_product_takes_five_queries(self):
+        """Products, subcategories, variant members and two for specifications."""
+        product = self.products[0]
+        with self.assertNumQueries(5):
+            aggregates = self.repo.get_aggregates([product.id])
+        
+        aggregate = aggregates[product.id]
+        self.assertEqual(len(aggregate.subcategories), 3)
+        self.assertEqual(len(aggregate.variants), 2)
+        self.assertEqual(aggregate.specifications['material'], 'leather')
+        self.assertEqual(len(aggregate.specifications_detailed), 3)
+    
+    def test_query_count_does_not_grow_with_products(self):
+        with self.assertNumQueries(5):
+            aggregates = self.repo.get_aggregates([p.id for p in self.products])
+        self.assertEqual(len(aggregates), 3)
+    
+    def test_cached_variant_previews_skip_their_query(self):
+        product = self.products[0]
+        self.repo.get_aggregates([product.id])
+        with self.assertNumQueries(4):
+            self.repo.get_aggregates([product.id])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SpecFilterTests(TestCase):
+    """Number spec filters skip values they cannot compare instead of failing."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Bags', slug='bags')
+        width = Attribute.objects.create(
+            scope_type='category', scope_id=category.id, key='width_cm',
+            label='Width', data_type='NUMBER', unit='cm'
+        )
+        for value in (20, 21, 22):
+            product = Product.objects.create(
+                name=f'Bag {value}', price=Decimal('49.00'), category=category
+            )
+            ProductAttributeValue.objects.create(
+                product=product, attribute=width, value_number=Decimal(value)
+            )
+    
+    def setUp(self):
+        clear_caches()
+        self.repo = DjangoProductRepository()
+    
+    def _total(self, spec_filters):
+        _, total = self.repo.get_all(spec_filters=spec_filters)
+        return total
+    
+    def test_number_filters(self):
+        self.assertEqual(self._total({'width_cm': '20,22'}), 2)
+        self.assertEqual(self._total({'width_cm__gte': '21'}), 2)
+        self.assertEqual(self._total({'width_cm__lt': '21'}), 1)
+    
+    def test_non_finite_numbers_are_ignored(self):
+        for value in ('inf', 'Infinity', '-inf', 'NaN', 'sNaN', '20,NaN'):
+            for key in ('width_cm', 'width_cm__exact', 'width_cm__gte', 'width_cm__lt'):
+                with self.subTest(key=key, value=value):
+                    self.assertEqual(self._total({key: value}), 3)
+    
+    def test_range_with_several_values_is_ignored(self):
+        self.assertEqual(self._total({'width_cm__gte': '21,22'}), 3)
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    PRODUCT_READ_MODEL_ENABLED=True
+)
+class ProductListingRefreshTests(TestCase):
+    """Read model payloads are refreshed after commit in a fixed number of queries."""
+    
+    def setUp(self):
+        clear_caches()
+        self.group = VariantGroup.objects.create(name='Tote', slug='tote')
+        self.products = []
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(3):
+                category = Category.objects.create(name=f'Category {index}', slug=f'category-{index}')
+                subcategory = Subcategory.objects.create(
+                    category=category, name=f'Sub {index}', slug=f'sub-{index}'
+                )
+                product = Product.objects.create(
+                    name=f'Tote {index}', price=Decimal('30.00'),
+                    category=category, variant_group=self.group
+                )
+                product.subcategories.set([subcategory])
+                self.products.append(product)
+    
+    def _payload(self, product):
+        return ProductListing.objects.get(product=product).payload
+    
+    def test_refresh_queries_do_not_grow_with_categories(self):
+        def refresh_queries(products):
+            with self.captureOnCommitCallbacks() as callbacks:
+                for product in products:
+                    product.save()
+            with CaptureQueriesContext(connection) as queries:
+                for callback in callbacks:
+                    callback()
+            return len(queries)
+        
+        self.assertEqual(refresh_queries(self.products[:1]), refresh_queries(self.products))
+    
+    def test_category_rename_refreshes_payloads(self):
+        category = self.products[0].category
+        category.name = 'Renamed'
+        with self.captureOnCommitCallbacks(execute=True):
+            category.save()
+        self.assertEqual(self._payload(self.products[0])['category']['name'], 'Renamed')
+    
+    def test_deleting_variant_group_refreshes_members(self):
+        self.assertEqual(self._payload(self.products[0])['variant_group_id'], self.group.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.delete()
+        for product in self.products:
+            self.assertIsNone(self._payload(product)['variant_group_id'])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SearchIndexSignalTests(TestCase):
+    """Search documents are rebuilt once per product after commit."""
+    
+    def setUp(self):
+        clear_caches()
+        self.category = Category.objects.create(name='Bags', slug='bags')
+        self.material = Attribute.objects.create(
+            scope_type='category', scope_id=self.category.id, key='material',
+            label='Material', data_type='TEXT'
+        )
+        self.repo = DjangoProductRepository()
+    
+    def _found(self, query):
+        products, _ = self.repo.get_all(search=query)
+        return [product.name for product in products]
+    
+    def _create_product(self):
+        product = Product.objects.create(name='Tote', price=Decimal('30.00'), category=self.category)
+        for value in ('leather', 'canvas', 'suede'):
+            attribute = Attribute.objects.create(
+                scope_type='product', scope_id=product.id, key=f'layer_{value}',
+                label=value.title(), data_type='TEXT'
+            )
+            ProductAttributeValue.objects.create(product=product, attribute=attribute, value_text=value)
+        ProductAttributeValue.objects.create(
+            product=product, attribute=self.material, value_text='waxed cotton'
+        )
+        return product
+    
+    def test_product_is_indexed_once_after_commit(self):
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                self._create_product()
+                self.assertEqual(self._found('suede'), [])
+        
+        index_writes = [
+            query for query in queries.captured_queries
+            if 'INSERT INTO product_search' in query['sql']
+        ]
+        self.assertEqual(len(index_writes), 1)
+        self.assertEqual(self._found('suede'), ['Tote'])
+    
+    def test_deleted_product_leaves_the_index(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            product = self._create_product()
+        with self.captureOnCommitCallbacks(execute=True):
+            product.delete()
+        self.assertEqual(self._found('tote'), [])
+    
+    def test_attribute_data_type_change_reindexes_its_products(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_product()
+        self.assertEqual(self._found('waxed'), ['Tote'])
+        
+        self.material.data_type = 'SINGLE_SELECT'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.material.save()
+        self.assertEqual(self._found('waxed'), [])
+        
+        self.material.data_type = 'TEXT'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.material.save()
+        self.assertEqual(self._found('waxed'), ['Tote'])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, DATABASE_REPLICA_STICKY_SECONDS=10)
+class ReadReplicaRouterTests(SimpleTestCase):
+    """Which reads the replica router sends to a replica."""
+    
+    def setUp(self):
+        clear_caches()
+        # Every stamp last moved a minute ago, well past the sticky window
+        for stamp in _STAMPS:
+            shared_cache.set(stamp.cache_key, time.time_ns() - 60 * 1_000_000_000, timeout=None)
+        self.router = ReadReplicaRouter()
+        self.router.replicas = ['replica']
+        begin_replica_reads(pinned=False)
+        self.addCleanup(end_replica_reads)
+    
+    def test_catalog_reads_go_to_the_replica(self):
+        self.assertEqual(self.router.db_for_read(Product), 'replica')
+        self.assertEqual(self.router.db_for_read(Category), 'replica')
+    
+    def test_other_models_stay_on_the_primary(self):
+        self.assertEqual(self.router.db_for_read(User), 'default')
+    
+    def test_reads_outside_requests_stay_on_the_primary(self):
+        end_replica_reads()
+        self.assertEqual(self.router.db_for_read(Product), 'default')
+    
+    def test_pinned_clients_read_from_the_primary(self):
+        begin_replica_reads(pinned=True)
+        self.assertEqual(self.router.db_for_read(Product), 'default')
+    
+    def test_reads_after_a_write_stay_on_the_primary(self):
+        self.assertEqual(self.router.db_for_write(Product), 'default')
+        self.assertEqual(self.router.db_for_read(Product), 'default')
+    
+    def test_reads_after_a_stamp_bump_stay_on_the_primary(self):
+        CATALOG_VERSION.bump()
+        self.assertEqual(self.router.db_for_read(Product), 'default')
+        
+        # Until the bump is older than the sticky window
+        shared_cache.set(
+            CATALOG_VERSION.cache_key, time.time_ns() - 11 * 1_000_000_000, timeout=None
+        )
+        begin_replica_reads(pinned=False)
+        self.assertEqual(self.router.db_for_read(Product), 'replica')
+    
+    def test_any_stamp_keeps_reads_on_the_primary(self):
+        HOMEPAGE_VERSION.bump()
+        self.assertEqual(self.router.db_for_read(Product), 'default')
+    
+    def test_writing_request_pins_the_client(self):
+        def view(request):
+            self.router.db_for_write(Product)
+            return HttpResponse()
+        
+        factory = RequestFactory()
+        middleware = ReplicaStickinessMiddleware(view)
+        response = middleware(factory.post('/'))
+        self.assertIn(ReplicaStickinessMiddleware.cookie_name, response.cookies)
+        
+        def read_view(request):
+            return HttpResponse(self.router.db_for_read(Product))
+        
+        middleware = ReplicaStickinessMiddleware(read_view)
+        self.assertEqual(middleware(factory.get('/')).content, b'replica')
+        factory.cookies[ReplicaStickinessMiddleware.cookie_name] = '1'
+        self.assertEqual(middleware(factory.get('/')).content, b'default')
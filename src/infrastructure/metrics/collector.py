@@ -0,0 +1,389 @@
+"""Prometheus metrics aggregated across the worker processes of one host.
+
+Each process counts in memory; a background thread writes its values to
+``<METRICS_DIR>/<pid>-<start time>.json`` every ``METRICS_FLUSH_INTERVAL``
+seconds. When a process exits, or is found dead by a starting process or a
+scrape, its counters and histograms are folded into ``archive.json`` and its
+file is removed (as ``prometheus_client``'s ``mark_process_dead`` does), so
+totals don't drop when a worker is replaced and gauges cover live processes
+only. ``render()`` sums the archive and the files of live processes into the
+Prometheus text exposition format.
+"""
+import atexit
+import fcntl
+import json
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+
+
+Labels = Tuple[Tuple[str, str], ...]
+SampleKey = Tuple[str, Labels]
+
+
+class _ProcessValues:
+    """Sample values of the current process, flushed to its own file."""
+    
+    def __init__(self, directory: Optional[str], flush_interval: float):
+        self.pid = os.getpid()
+        # Tells this process' file from one left by an earlier process with the same pid
+        self.token = f'{self.pid}-{time.time_ns()}'
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.values: Dict[SampleKey, float] = defaultdict(float)
+        self.lock = threading.Lock()
+        # Held while writing or retiring the file, so a flush never recreates it
+        self.write_lock = threading.RLock()
+        self.dirty = False
+        self.retired = False
+        self._flusher: Optional[threading.Thread] = None
+    
+    @property
+    def filename(self) -> str:
+        return f'{self.token}.json'
+    
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, self.filename)
+    
+    def add(self, amounts: Iterable[Tuple[SampleKey, float]]) -> None:
+        with self.lock:
+            for key, amount in amounts:
+                self.values[key] += amount
+            self.dirty = True
+        if self._flusher is None and self.directory is not None:
+            self._start_flusher()
+    
+    def flush(self) -> None:
+        """Write this process' values, replacing its previous file atomically."""
+        if self.directory is None:
+            return
+        with self.write_lock:
+            with self.lock:
+                if not self.dirty or self.retired:
+                    return
+                samples = [[name, list(labels), value] for (name, labels), value in self.values.items()]
+                self.dirty = False
+            os.makedirs(self.directory, exist_ok=True)
+            _write_json(self.path, {'pid': self.pid, 'samples': samples})
+    
+    def retire(self) -> None:
+        """Fold this process' values into the archive and remove its file (at exit)."""
+        if self.directory is None:
+            return
+        with self.write_lock:
+            self.flush()
+            with self.lock:
+                self.retired = True
+            with _directory_lock(self.directory):
+                _archive(self.directory, [self.filename])
+    
+    def _start_flusher(self) -> None:
+        with self.lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name='metrics-flusher', daemon=True
+            )
+        self._flusher.start()
+        atexit.register(self.retire)
+        # Clean up after workers that died without running their atexit hooks
+        _sweep_dead_processes(self)
+    
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except OSError:
+                # Retried on the next tick; metrics must never break serving
+                self.dirty = True
+
+
+_current: Optional[_ProcessValues] = None
+_current_lock = threading.Lock()
+
+
+def _process_values() -> _ProcessValues:
+    """Values of this process; a forked child starts from zero, never from its parent's."""
+    global _current
+    current = _current
+    if current is not None and current.pid == os.getpid():
+        return current
+    with _current_lock:
+        if _current is None or _current.pid != os.getpid():
+            _current = _ProcessValues(
+                settings.METRICS_DIR if settings.METRICS_ENABLED else None,
+                settings.METRICS_FLUSH_INTERVAL
+            )
+        return _current
+
+
+class Metric:
+    """A metric family; samples are identified by their label values."""
+    type = 'untyped'
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        _registry.append(self)
+    
+    def _labels(self, labels: Dict[str, str]) -> Labels:
+        return tuple((name, str(labels[name])) for name in self.labelnames)
+
+
+class Counter(Metric):
+    """Monotonically increasing count, summed over all processes."""
+    type = 'counter'
+    
+    def inc(self, amount: float = 1, **labels) -> None:
+        _process_values().add([((f'{self.name}_total', self._labels(labels)), amount)])
+
+
+class Gauge(Metric):
+    """Current value, summed over live processes."""
+    type = 'gauge'
+    
+    def inc(self, amount: float = 1, **labels) -> None:
+        _process_values().add([((self.name, self._labels(labels)), amount)])
+    
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets."""
+    type = 'histogram'
+    
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+    
+    def observe(self, value: float, **labels) -> None:
+        base = self._labels(labels)
+        # Every bucket, even at 0, so all series of the family share one layout
+        _process_values().add(
+            [
+                ((f'{self.name}_bucket', base + (('le', _format_value(bound)),)), int(value <= bound))
+                for bound in self.buckets
+            ] + [
+                ((f'{self.name}_count', base), 1),
+                ((f'{self.name}_sum', base), value),
+            ]
+        )
+
+
+_registry: List[Metric] = []
+
+_SUFFIXES = {
+    'counter': ('_total',),
+    'histogram': ('_bucket', '_count', '_sum'),
+}
+
+
+def render() -> str:
+    """All metrics of all processes in the Prometheus text format (0.0.4)."""
+    own = _process_values()
+    own.flush()
+    
+    families = _families()
+    totals: Dict[SampleKey, float] = defaultdict(float)
+    for name, labels, value in _read_samples(own):
+        if name in families:
+            totals[(name, tuple(tuple(label) for label in labels))] += value
+    
+    lines = []
+    for metric in _registry:
+        family = f'{metric.name}_total' if metric.type == 'counter' else metric.name
+        lines.append(f'# HELP {family} {metric.documentation}')
+        lines.append(f'# TYPE {family} {metric.type}')
+        samples = sorted(
+            ((key, value) for key, value in totals.items() if families[key[0]] is metric),
+            key=_sample_order
+        )
+        for (name, labels), value in samples:
+            lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+def _families() -> Dict[str, Metric]:
+    """Registered metrics by the sample names they write."""
+    families = {}
+    for metric in _registry:
+        for suffix in _SUFFIXES.get(metric.type, ('',)):
+            families[f'{metric.name}{suffix}'] = metric
+    return families
+
+
+ARCHIVE_FILENAME = 'archive.json'
+
+
+def _read_samples(own: _ProcessValues) -> Iterable[Tuple[str, list, float]]:
+    """Samples of this process (from memory), other live processes and the archive."""
+    with own.lock:
+        samples = [[name, labels, value] for (name, labels), value in own.values.items()]
+    if own.directory is None or not os.path.isdir(own.directory):
+        return samples
+    
+    with _directory_lock(own.directory):
+        _archive(own.directory, _dead_process_files(own))
+        for filename in _process_files(own.directory):
+            if filename != own.filename:
+                samples.extend(_read_json(os.path.join(own.directory, filename)).get('samples', []))
+        samples.extend(_read_json(os.path.join(own.directory, ARCHIVE_FILENAME)).get('samples', []))
+    return samples
+
+
+def _sweep_dead_processes(own: _ProcessValues) -> None:
+    """Archive the files of processes that are gone."""
+    try:
+        with _directory_lock(own.directory):
+            _archive(own.directory, _dead_process_files(own))
+    except OSError:
+        # Retried on the next scrape
+        pass
+
+
+def _process_files(directory: str) -> List[str]:
+    """Per-process sample files (``<pid>-<start time>.json``)."""
+    return [
+        filename for filename in os.listdir(directory)
+        if filename.endswith('.json') and filename != ARCHIVE_FILENAME
+    ]
+
+
+def _dead_process_files(own: _ProcessValues) -> List[str]:
+    """Files of exited processes, including earlier holders of this process' pid."""
+    dead = []
+    for filename in _process_files(own.directory):
+        if filename == own.filename:
+            continue
+        try:
+            pid = int(filename[:-len('.json')].split('-')[0])
+        except ValueError:
+            continue
+        if pid == own.pid or not _pid_alive(pid):
+            dead.append(filename)
+    return dead
+
+
+def _archive(directory: str, filenames: List[str]) -> None:
+    """Add the counters and histograms of finished processes to the archive.
+    
+    Gauges are dropped, and the process files removed. The caller holds the
+    directory lock.
+    """
+    if not filenames:
+        return
+    families = _families()
+    archive_path = os.path.join(directory, ARCHIVE_FILENAME)
+    totals: Dict[SampleKey, float] = defaultdict(float)
+    for data in [_read_json(archive_path)] + [
+        _read_json(os.path.join(directory, filename)) for filename in filenames
+    ]:
+        for name, labels, value in data.get('samples', []):
+            metric = families.get(name)
+            if metric is not None and metric.type != 'gauge':
+                totals[(name, tuple(tuple(label) for label in labels))] += value
+    
+    _write_json(archive_path, {
+        'samples': [[name, list(labels), value] for (name, labels), value in totals.items()]
+    })
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(directory, filename))
+        except FileNotFoundError:
+            pass
+
+
+@contextmanager
+def _directory_lock(directory: str) -> Iterator[None]:
+    """Serialize archiving and reading across the processes sharing a directory."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, '.lock'), 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _read_json(path: str) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # Removed or never written
+        return {}
+
+
+def _write_json(path: str, data: dict) -> None:
+    """Replace a file atomically."""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _sample_order(sample: Tuple[SampleKey, float]):
+    """Series by labels; histogram buckets in ascending order, then _count and _sum."""
+    (name, labels), _ = sample
+    return (
+        tuple(label for label in labels if label[0] != 'le'),
+        not name.endswith('_bucket'),
+        float(dict(labels).get('le', 0)),
+        name,
+    )
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    escaped = (
+        f'{name}="' + value.replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"') + '"'
+        for name, value in labels
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def _format_value(value: float) -> str:
+    return '+Inf' if value == math.inf else repr(float(value))
+
+
+REQUESTS_IN_FLIGHT = Gauge('http_requests_in_flight', 'Requests being served.')
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'Request latency by URL name.',
+    ('route', 'method', 'status')
+)
+DB_QUERIES = Counter('db_queries', 'SQL queries run while serving requests.', ('route',))
+CACHE_REQUESTS = Counter(
+    'cache_requests',
+    'Application cache lookups by cache and result (hit or miss).',
+    ('cache', 'result')
+)
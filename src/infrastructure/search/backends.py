@@ -0,0 +1,255 @@
+"""Product full-text search backends.
+
+Each backend owns a ``product_search`` table holding one search document per
+product (name, brand, variant color name and TEXT attribute values), filters
+product querysets against it and ranks matches. Documents are refreshed
+incrementally by signal handlers and can be rebuilt with the
+``rebuild_search_index`` management command.
+"""
+import re
+from abc import ABC, abstractmethod
+from typing import Optional, List
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q, FloatField
+from django.db.models.expressions import RawSQL
+
+
+SEARCH_TABLE = 'product_search'
+
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def _tokenize(query: str) -> List[str]:
+    """Split a user query into word tokens."""
+    return _TOKEN_RE.findall(query.lower())
+
+
+class ProductSearchBackend(ABC):
+    """Product search backend interface."""
+    
+    @abstractmethod
+    def filter(self, queryset, query: str):
+        """Restrict a product queryset to products matching the query."""
+        pass
+    
+    @abstractmethod
+    def order_by_rank(self, queryset, query: str):
+        """Order a filtered product queryset by relevance, best first."""
+        pass
+    
+    @abstractmethod
+    def index_products(self, product_ids: List[int]) -> None:
+        """Rebuild the search documents of the given products."""
+        pass
+    
+    @abstractmethod
+    def remove_products(self, product_ids: List[int]) -> None:
+        """Drop the search documents of the given products."""
+        pass
+    
+    @abstractmethod
+    def rebuild(self) -> None:
+        """Rebuild the search documents of all products."""
+        pass
+
+
+class SimpleSearchBackend(ProductSearchBackend):
+    """Substring search on name and brand (no index, no ranking)."""
+    
+    def filter(self, queryset, query: str):
+        """Restrict a product queryset to products matching the query."""
+        return queryset.filter(Q(name__icontains=query) | Q(brand__icontains=query))
+    
+    def order_by_rank(self, queryset, query: str):
+        """Keep the default ordering."""
+        return queryset
+    
+    def index_products(self, product_ids: List[int]) -> None:
+        """Nothing to index."""
+        pass
+    
+    def remove_products(self, product_ids: List[int]) -> None:
+        """Nothing to remove."""
+        pass
+    
+    def rebuild(self) -> None:
+        """Nothing to rebuild."""
+        pass
+
+
+class PostgresSearchBackend(ProductSearchBackend):
+    """``tsvector`` documents with a GIN index, ranked by ``ts_rank``."""
+    
+    def __init__(self, config: Optional[str] = None):
+        self.config = config or getattr(settings, 'PRODUCT_SEARCH_CONFIG', 'english')
+    
+    def filter(self, queryset, query: str):
+        """Restrict a product queryset to products matching the query."""
+        tsquery = self._to_tsquery(query)
+        if tsquery is None:
+            return SimpleSearchBackend().filter(queryset, query)
+        return queryset.filter(id__in=RawSQL(
+            f"SELECT product_id FROM {SEARCH_TABLE} "
+            f"WHERE document @@ to_tsquery(%s::regconfig, %s)",
+            [self.config, tsquery]
+        ))
+    
+    def order_by_rank(self, queryset, query: str):
+        """Order a filtered product queryset by ts_rank, best first."""
+        tsquery = self._to_tsquery(query)
+        if tsquery is None:
+            return queryset
+        return queryset.annotate(search_rank=RawSQL(
+            f"SELECT ts_rank(document, to_tsquery(%s::regconfig, %s)) "
+            f"FROM {SEARCH_TABLE} WHERE product_id = products.id",
+            [self.config, tsquery],
+            output_field=FloatField()
+        )).order_by('-search_rank', '-created_at')
+    
+    def index_products(self, product_ids: List[int]) -> None:
+        """Rebuild the search documents of the given products."""
+        if product_ids:
+            self._upsert("WHERE p.id = ANY(%s)", [list(product_ids)])
+    
+    def remove_products(self, product_ids: List[int]) -> None:
+        """Drop the search documents of the given products."""
+        if product_ids:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"DELETE FROM {SEARCH_TABLE} WHERE product_id = ANY(%s)",
+                    [list(product_ids)]
+                )
+    
+    def rebuild(self) -> None:
+        """Rebuild the search documents of all products."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {SEARCH_TABLE}")
+        self._upsert("", [])
+    
+    def _upsert(self, where: str, params: list) -> None:
+        """Compute and store documents for the products matched by ``where``."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {SEARCH_TABLE} (product_id, document)
+                SELECT p.id,
+                    setweight(to_tsvector(%s::regconfig, coalesce(p.name, '')), 'A')
+                    || setweight(to_tsvector(%s::regconfig, coalesce(p.brand, '')), 'B')
+                    || setweight(to_tsvector(%s::regconfig, coalesce(p.variant_color_name, '')), 'B')
+                    || setweight(to_tsvector(%s::regconfig, coalesce((
+                        SELECT string_agg(v.value_text, ' ')
+                        FROM product_attribute_values v
+                        JOIN attributes a ON a.id = v.attribute_id
+                        WHERE v.product_id = p.id AND a.data_type = 'TEXT'
+                    ), '')), 'C')
+                FROM products p
+                {where}
+                ON CONFLICT (product_id) DO UPDATE SET document = EXCLUDED.document
+                """,
+                [self.config] * 4 + params
+            )
+    
+    def _to_tsquery(self, query: str) -> Optional[str]:
+        """Build a prefix-matching tsquery (``bag:* & red:*``)."""
+        tokens = _tokenize(query)
+        if not tokens:
+            return None
+        return ' & '.join(f'{token}:*' for token in tokens)
+
+
+class SQLiteSearchBackend(ProductSearchBackend):
+    """FTS5 virtual table keyed by product id, ranked by ``bm25``."""
+    
+    # bm25 column weights: name, brand, color, attributes
+    WEIGHTS = '10.0, 4.0, 4.0, 1.0'
+    
+    def filter(self, queryset, query: str):
+        """Restrict a product queryset to products matching the query."""
+        match = self._to_match(query)
+        if match is None:
+            return SimpleSearchBackend().filter(queryset, query)
+        return queryset.filter(id__in=RawSQL(
+            f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s",
+            [match]
+        ))
+    
+    def order_by_rank(self, queryset, query: str):
+        """Order a filtered product queryset by bm25, best first."""
+        match = self._to_match(query)
+        if match is None:
+            return queryset
+        # bm25 is lower-is-better; negate it so both backends sort descending
+        return queryset.annotate(search_rank=RawSQL(
+            f"SELECT -bm25({SEARCH_TABLE}, {self.WEIGHTS}) FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s AND rowid = products.id",
+            [match],
+            output_field=FloatField()
+        )).order_by('-search_rank', '-created_at')
+    
+    def index_products(self, product_ids: List[int]) -> None:
+        """Rebuild the search documents of the given products."""
+        if not product_ids:
+            return
+        placeholders = ', '.join(['%s'] * len(product_ids))
+        self.remove_products(product_ids)
+        self._insert(f"WHERE p.id IN ({placeholders})", list(product_ids))
+    
+    def remove_products(self, product_ids: List[int]) -> None:
+        """Drop the search documents of the given products."""
+        if not product_ids:
+            return
+        placeholders = ', '.join(['%s'] * len(product_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({placeholders})",
+                list(product_ids)
+            )
+    
+    def rebuild(self) -> None:
+        """Rebuild the search documents of all products."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        self._insert("", [])
+    
+    def _insert(self, where: str, params: list) -> None:
+        """Compute and store documents for the products matched by ``where``."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {SEARCH_TABLE} (rowid, name, brand, color, attributes)
+                SELECT p.id,
+                    p.name,
+                    coalesce(p.brand, ''),
+                    coalesce(p.variant_color_name, ''),
+                    coalesce((
+                        SELECT group_concat(v.value_text, ' ')
+                        FROM product_attribute_values v
+                        JOIN attributes a ON a.id = v.attribute_id
+                        WHERE v.product_id = p.id AND a.data_type = 'TEXT'
+                    ), '')
+                FROM products p
+                {where}
+                """,
+                params
+            )
+    
+    def _to_match(self, query: str) -> Optional[str]:
+        """Build a prefix-matching FTS5 query (``"bag"* "red"*``)."""
+        tokens = _tokenize(query)
+        if not tokens:
+            return None
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def get_search_backend() -> ProductSearchBackend:
+    """Return the backend for ``PRODUCT_SEARCH_BACKEND`` (``auto`` by vendor)."""
+    name = getattr(settings, 'PRODUCT_SEARCH_BACKEND', 'auto')
+    if name == 'auto':
+        name = {'postgresql': 'postgres', 'sqlite': 'sqlite'}.get(connection.vendor, 'simple')
+    if name == 'postgres':
+        return PostgresSearchBackend()
+    if name == 'sqlite':
+        return SQLiteSearchBackend()
+    return SimpleSearchBackend()